@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Benchmark: `PersonDescriptor` descriptions per second against people per prompt.
+
+Describes the same attendees at each `people_per_prompt` setting against a local model
+(Ollama by default) and reports throughput and how many people had to fall back to a
+single-person call. Needs npcpy and a running model server. Run from the project directory:
+
+    python benchmark_descriptor_batching.py --model qwen3:0.6b --batch-sizes 1 2 4 8 16
+"""
+import argparse
+import time
+
+from data_classes import ConferenceSimulator, PersonDescriptor, TIME_SLOTS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--model", default="qwen3:0.6b")
+    parser.add_argument("--provider", default="ollama")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--people", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    simulator = ConferenceSimulator(num_attendees=args.people, seed=args.seed)
+    batch = [(simulator.attendees[i], TIME_SLOTS[i % len(TIME_SLOTS)]) for i in range(args.people)]
+
+    print(f"{'per prompt':>10} {'seconds':>9} {'desc/s':>8} {'fallbacks':>10}")
+    for size in args.batch_sizes:
+        descriptor = PersonDescriptor(people_per_prompt=size, llm_kwargs={"model": args.model, "provider": args.provider})
+        single = descriptor._describe
+        fallbacks = []
+        descriptor._describe = lambda prompt: fallbacks.append(1) or single(prompt)
+        start = time.perf_counter()
+        descriptions = descriptor.generate_descriptions(batch, max_concurrency=args.concurrency)
+        elapsed = time.perf_counter() - start
+        # With one person per prompt every call goes through the single-person path by design.
+        print(f"{size:>10} {elapsed:>9.2f} {len(descriptions) / elapsed:>8.2f} {len(fallbacks) if size > 1 else 0:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Report: accuracy vs. latency of float32, bfloat16 and dynamic-int8 CPU inference.
+
+For each precision, loads the SFT `MeetingPredictor` and scores the validation split of
+the SFT data (the last 20%, as in `starter_sft.py`), reporting weight size, per-example
+latency, MAE, correlation, YES/NO outcome accuracy and parse failures. With --agent the
+Qwen agent model from `load_trained_model` is timed on a fixed prompt too, along with
+whether its greedy output matches float32. Run from the project directory:
+
+    python benchmark_inference_precision.py --samples 100 --readout logits --agent
+"""
+import argparse
+import io
+import re
+import time
+
+import numpy as np
+import pandas as pd
+import torch
+
+from data_classes import INFERENCE_PRECISIONS, MeetingPredictor, get_true_outcome
+
+
+def model_megabytes(model: torch.nn.Module) -> float:
+    """Serialized state_dict size, which also counts packed int8 weights."""
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell() / 2**20
+
+
+def load_validation_split(path: str, samples: int):
+    df = pd.read_csv(path)
+    examples, truths = [], []
+    for _, row in df.iloc[int(0.8 * len(df)):].iterrows():
+        match = re.search(r"Person A: (.*?)\nPerson B: (.*?)\nTime: (.*?)\n", row['input_text'], re.DOTALL)
+        if match:
+            examples.append(match.groups())
+            truths.append(float(row['ground_truth_prob']))
+        if len(examples) == samples: break
+    return examples, np.array(truths)
+
+
+def report_predictor(args):
+    examples, truths = load_validation_split(args.data, args.samples)
+    print(f"MeetingPredictor ({args.readout} readout) on {len(examples)} validation examples")
+    print(f"{'precision':<10} {'MB':>8} {'ms/example':>11} {'MAE':>7} {'corr':>7} {'outcome':>8} {'failures':>9}")
+    for precision in args.precisions:
+        predictor = MeetingPredictor(args.adapter, readout=args.readout, precision=precision)
+        predictor.model.eval()
+        start = time.perf_counter()
+        if args.readout == "logits":
+            predictions = predictor.predict_probability_batch(examples, batch_size=args.batch_size)
+        else:
+            results = predictor.predict_batch(examples, batch_size=args.batch_size)
+            predictions = np.array([float(r['probability']) if r and 'probability' in r else np.nan for r in results])
+        elapsed = time.perf_counter() - start
+        ok = ~np.isnan(predictions)
+        outcome = np.mean([get_true_outcome(p) == get_true_outcome(t) for p, t in zip(predictions[ok], truths[ok])])
+        print(f"{precision:<10} {model_megabytes(predictor.model):>8.1f} {elapsed / len(examples) * 1e3:>11.1f} "
+              f"{np.mean(np.abs(predictions[ok] - truths[ok])):>7.4f} {np.corrcoef(predictions[ok], truths[ok])[0, 1]:>7.4f} "
+              f"{outcome:>8.3f} {int((~ok).sum()):>9}")
+
+
+def report_agent(args):
+    from starter_agentic_rlft import load_trained_model
+    prompt = ("Your task is to decide if two people should meet. Person A: a senior engineer with low energy. "
+              "Person B: a sales exec in a positive mood. Time Slot: Day1 Morning. Respond with a JSON recommendation.")
+    print(f"\nAgent model {args.agent_base} on a fixed prompt ({args.agent_tokens} new tokens)")
+    print(f"{'precision':<10} {'MB':>8} {'tokens/s':>9} {'matches fp32':>13}")
+    reference = None
+    for precision in args.precisions:
+        model, tokenizer = load_trained_model(args.agent_base, args.agent_adapter, precision=precision)
+        inputs = tokenizer(prompt, return_tensors="pt").to(next(model.parameters()).device)
+        start = time.perf_counter()
+        with torch.no_grad():
+            outputs = model.generate(**inputs, max_new_tokens=args.agent_tokens, min_new_tokens=args.agent_tokens, do_sample=False,
+                                     pad_token_id=tokenizer.eos_token_id)
+        elapsed = time.perf_counter() - start
+        text = tokenizer.decode(outputs[0][inputs['input_ids'].shape[1]:], skip_special_tokens=True)
+        reference = text if reference is None else reference
+        print(f"{precision:<10} {model_megabytes(model):>8.1f} {args.agent_tokens / elapsed:>9.2f} {str(text == reference):>13}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--adapter", default="models/sft_prediction_model_gemma_270m")
+    parser.add_argument("--data", default="data/sft_training_data.csv")
+    parser.add_argument("--samples", type=int, default=100)
+    parser.add_argument("--readout", choices=["generate", "logits"], default="logits")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--precisions", nargs="+", choices=INFERENCE_PRECISIONS, default=list(INFERENCE_PRECISIONS))
+    parser.add_argument("--agent", action="store_true", help="Also time the Qwen agent model (needs npcpy)")
+    parser.add_argument("--agent-base", default="Qwen/Qwen3-0.6B")
+    parser.add_argument("--agent-adapter", default="./qwen3-dpo-adapter-v1")
+    parser.add_argument("--agent-tokens", type=int, default=64)
+    args = parser.parse_args()
+
+    report_predictor(args)
+    if args.agent: report_agent(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: `MeetingOracle` vs. the SFT `predict_meeting_success_tool`.
+
+Scores fresh evaluation scenarios (like `evaluate_model_performance`, described by
+`TemplatePersonDescriptor`) with the fitted oracle through the same description-parsing
+path the agent tool uses, and reports MAE, correlation, YES/NO outcome accuracy and
+per-call latency. The simulator's own noise-free probability is shown for reference.
+Pass --predictor to also run the SFT tool, which needs npcpy and a trained adapter. Run
+from the project directory:
+
+    python benchmark_oracle.py --scenarios 2000 --predictor
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from data_classes import ConferenceSimulator, MeetingOracle, TemplatePersonDescriptor, TIME_SLOTS, get_true_outcome, parse_person_profile, parse_time_slot
+
+
+def report(name: str, predictions: np.ndarray, truths: np.ndarray, latencies: np.ndarray):
+    accuracy = np.mean([get_true_outcome(p) == get_true_outcome(t) for p, t in zip(predictions, truths)])
+    print(f"{name:<22} {len(predictions):>6,} {np.mean(np.abs(predictions - truths)):>7.4f} {np.corrcoef(predictions, truths)[0, 1]:>7.4f} "
+          f"{accuracy:>9.3f} {np.mean(latencies) * 1e3:>10.3f} {np.percentile(latencies, 95) * 1e3:>10.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenarios", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=37)
+    parser.add_argument("--predictor", action="store_true", help="Also benchmark predict_meeting_success_tool")
+    parser.add_argument("--predictor-scenarios", type=int, default=100)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    oracle = MeetingOracle.fit()
+    print(f"Oracle fitted in {time.perf_counter() - start:.2f}s")
+
+    rng = np.random.default_rng(args.seed)
+    descriptor = TemplatePersonDescriptor(seed=args.seed)
+    scenarios = []
+    for simulator in ConferenceSimulator.spawn(args.scenarios, num_attendees=2000, seed=args.seed):
+        a, b = rng.choice(2000, size=2, replace=False)
+        time_slot = TIME_SLOTS[rng.integers(len(TIME_SLOTS))]
+        _, ground_truth = simulator.score_pairs([a], [b], time_slot)
+        scenarios.append((*descriptor.generate_descriptions([(simulator.attendees[int(a)], time_slot), (simulator.attendees[int(b)], time_slot)]),
+                          time_slot.value.replace('_', ' ').title(), float(ground_truth[0]),
+                          float(simulator.expected_success_prob([a], [b], time_slot)[0])))
+    truths = np.array([s[3] for s in scenarios])
+
+    print(f"\n{'model':<22} {'n':>6} {'MAE':>7} {'corr':>7} {'outcome':>9} {'mean (ms)':>10} {'p95 (ms)':>10}")
+    report("simulator noise-free", np.array([s[4] for s in scenarios]), truths, np.zeros(len(scenarios)))
+    predictions, latencies = [], []
+    for a_desc, b_desc, ts_str, _, _ in scenarios:
+        start = time.perf_counter()
+        predictions.append(oracle.predict_profiles(parse_person_profile(a_desc), parse_person_profile(b_desc), parse_time_slot(ts_str)))
+        latencies.append(time.perf_counter() - start)
+    report("MeetingOracle", np.array(predictions), truths, np.array(latencies))
+
+    if args.predictor:
+        from starter_agentic_traces import predict_meeting_success_tool
+        predictions, kept, latencies = [], [], []
+        for a_desc, b_desc, ts_str, truth, _ in scenarios[:args.predictor_scenarios]:
+            start = time.perf_counter()
+            result = json.loads(predict_meeting_success_tool(a_desc, b_desc, ts_str))
+            latencies.append(time.perf_counter() - start)
+            if result.get("status") == "success":
+                predictions.append(float(result["probability"]))
+                kept.append(truth)
+        if predictions: report("predict_meeting_success", np.array(predictions), np.array(kept), np.array(latencies))
+        print(f"SFT tool answered {len(predictions)}/{len(latencies)} scenarios")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Benchmark: `solve_slot_pairing` solve time against attendee count.
+
+For each conference size, reports solve time, pairs scheduled and mean expected
+success, next to a random pairing of the same attendees. Sizes small enough for
+exhaustive scoring also report the pruned solver against the all-pairs solver.
+Run from the project directory:
+
+    python benchmark_pairing_solver.py --sizes 500 1000 2000 5000 10000 20000
+"""
+import argparse
+import time
+
+from data_classes import ConferenceSimulator, TimeSlot, random_pairing_policy, solve_slot_pairing
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 1000, 2000, 5000, 10000, 20000])
+    parser.add_argument("--candidates", type=int, default=16)
+    parser.add_argument("--pool-size", type=int, default=256)
+    parser.add_argument("--exhaustive-limit", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+    time_slot = TimeSlot.DAY1_AFTERNOON
+
+    print(f"{'attendees':>10} {'solve (s)':>10} {'pairs':>8} {'mean p':>8} {'random p':>9} {'exhaustive p':>13} {'exh. (s)':>9}")
+    for size in args.sizes:
+        simulator = ConferenceSimulator(num_attendees=size, seed=args.seed)
+        start = time.perf_counter()
+        a_ids, b_ids = solve_slot_pairing(simulator, time_slot, candidates=args.candidates, pool_size=args.pool_size)
+        solve_time = time.perf_counter() - start
+        solved_p = simulator.expected_success_prob(a_ids, b_ids, time_slot).mean()
+        random_a, random_b = random_pairing_policy(simulator, time_slot, participation=1.0)
+        random_p = simulator.expected_success_prob(random_a, random_b, time_slot).mean()
+
+        exhaustive = ""
+        if size <= args.exhaustive_limit:
+            start = time.perf_counter()
+            full_a, full_b = solve_slot_pairing(simulator, time_slot, pool_size=size)
+            full_time = time.perf_counter() - start
+            exhaustive = f"{simulator.expected_success_prob(full_a, full_b, time_slot).mean():>13.4f} {full_time:>9.3f}"
+        print(f"{size:>10,} {solve_time:>10.3f} {len(a_ids):>8,} {solved_p:>8.4f} {random_p:>9.4f} {exhaustive}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark: `MeetingPredictor.predict` loop vs. `predict_batch` and the logit readout
+(`predict_probability_batch`) at several batch sizes.
+
+Builds prompts from simulator attendees described by `TemplatePersonDescriptor` and
+reports examples/second and JSON parse failures for each setting on CPU (the logit
+readout never parses JSON). Needs the Gemma base model and a trained adapter. Run from
+the project directory:
+
+    python benchmark_predictor_batching.py --adapter models/sft_prediction_model_gemma_270m --batch-sizes 1 4 8 16 32
+"""
+import argparse
+import time
+
+import numpy as np
+import torch
+
+from data_classes import ConferenceSimulator, MeetingPredictor, TemplatePersonDescriptor, TIME_SLOTS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--adapter", default="models/sft_prediction_model_gemma_270m")
+    parser.add_argument("--examples", type=int, default=64)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+    if args.threads: torch.set_num_threads(args.threads)
+
+    simulator = ConferenceSimulator(num_attendees=1000, seed=args.seed)
+    descriptor = TemplatePersonDescriptor(seed=args.seed)
+    rng = np.random.default_rng(args.seed)
+    examples = []
+    for _ in range(args.examples):
+        a, b = rng.choice(1000, size=2, replace=False)
+        time_slot = TIME_SLOTS[rng.integers(len(TIME_SLOTS))]
+        a_desc, b_desc = descriptor.generate_descriptions([(simulator.attendees[int(a)], time_slot), (simulator.attendees[int(b)], time_slot)])
+        examples.append((a_desc, b_desc, time_slot.value.replace('_', ' ').title()))
+
+    predictor = MeetingPredictor(args.adapter)
+    predictor.model.eval()
+
+    print(f"{'mode':<18} {'seconds':>9} {'examples/s':>11} {'parse fails':>12}")
+    start = time.perf_counter()
+    failures = 0
+    for example in examples:
+        try:
+            predictor.predict(*example)
+        except ValueError:
+            failures += 1
+    elapsed = time.perf_counter() - start
+    print(f"{'predict loop':<18} {elapsed:>9.2f} {len(examples) / elapsed:>11.2f} {failures:>12}")
+    for batch_size in args.batch_sizes:
+        start = time.perf_counter()
+        results = predictor.predict_batch(examples, batch_size=batch_size)
+        elapsed = time.perf_counter() - start
+        print(f"{f'batch {batch_size}':<18} {elapsed:>9.2f} {len(examples) / elapsed:>11.2f} {sum(r is None for r in results):>12}")
+    for batch_size in args.batch_sizes:
+        start = time.perf_counter()
+        predictor.predict_probability_batch(examples, batch_size=batch_size)
+        elapsed = time.perf_counter() - start
+        print(f"{f'logits {batch_size}':<18} {elapsed:>9.2f} {len(examples) / elapsed:>11.2f} {0:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,22 @@
 
+import asyncio
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+import hashlib
+from itertools import count
 import json 
 import numpy as np
-from peft import PeftModel
-import random
-import torch 
-from transformers import AutoModelForCausalLM, AutoTokenizer
-from typing import Dict, List, Tuple
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+# torch, transformers and peft are imported where the model code uses them, so processes that only
+# run the simulator (e.g. run_simulation_ensemble workers under spawn) start without loading them.
 
 
 def calculate_accuracy_metrics(results: List[Dict]):
@@ -88,17 +97,618 @@ class Meeting:
     success: bool = False
     satisfaction: float = 0.0
 
+# Ordinal encodings used by the columnar population and the vectorized scorers.
+PERSON_TYPES: List[PersonType] = list(PersonType)
+TIME_SLOTS: List[TimeSlot] = list(TimeSlot)
+_TYPE_ORDINAL: Dict[PersonType, int] = {t: i for i, t in enumerate(PERSON_TYPES)}
+
+_SLOT_DAY = np.array([int(ts.value.split('_')[0][-1]) for ts in TIME_SLOTS])
+_SLOT_TIME_OF_DAY = [ts.value.split('_')[1] for ts in TIME_SLOTS]
+_SLOT_IS_MORNING = np.array([tod == "morning" for tod in _SLOT_TIME_OF_DAY])
+_SLOT_IS_EVENING = np.array([tod == "evening" for tod in _SLOT_TIME_OF_DAY])
+
+FACTOR_NAMES: List[str] = ["f_base_chem", "f_energy", "f_mood", "f_introvert_fatigue", "f_time_of_day", "f_day_fatigue",
+                            "f_seniority_mismatch", "f_memory", "f_network_effect"]
+
+# Value at which each factor neither helps nor hurts: default chemistry, sigmoid midpoints, then 1.0.
+_FACTOR_NEUTRAL = np.array([0.5, 0.5, 0.5, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0])
+# One-word (boost, drag) reasons per factor, in FACTOR_NAMES order.
+FACTOR_REASONS: Dict[str, Tuple[str, str]] = {
+    "f_base_chem": ("synergy", "mismatch"),
+    "f_energy": ("energized", "exhaustion"),
+    "f_mood": ("positivity", "gloom"),
+    "f_introvert_fatigue": ("freshness", "fatigue"),
+    "f_time_of_day": ("well-timed", "poorly-timed"),
+    "f_day_fatigue": ("early-conference", "late-conference"),
+    "f_seniority_mismatch": ("rapport", "intimidation"),
+    "f_memory": ("novelty", "repetition"),
+    "f_network_effect": ("shared-network", "isolation"),
+}
+_FACTOR_REASON_TABLE = np.array([FACTOR_REASONS[name] for name in FACTOR_NAMES])
+
+_TYPE_PROBS = np.array([0.15, 0.05, 0.20, 0.10, 0.05, 0.10, 0.10, 0.15, 0.05, 0.05])
+_JUNIOR_TYPES = np.array(["junior" in t.value for t in PERSON_TYPES])
+_SENIOR_TYPES = np.array(["senior" in t.value or "partner" in t.value or t == PersonType.EXECUTIVE for t in PERSON_TYPES])
+_INTROVERT_TYPES = np.array([t in (PersonType.JUNIOR_ENGINEER, PersonType.SENIOR_ENGINEER, PersonType.RESEARCHER) for t in PERSON_TYPES])
+_EXTROVERT_TYPES = np.array([t == PersonType.SALES_EXEC for t in PERSON_TYPES])
+_SENIORITY_RANGE = np.where(_JUNIOR_TYPES[:, None], [0.1, 0.4], np.where(_SENIOR_TYPES[:, None], [0.7, 1.0], [0.4, 0.7]))
+_INTROVERSION_RANGE = np.where(_INTROVERT_TYPES[:, None], [0.6, 0.9], np.where(_EXTROVERT_TYPES[:, None], [0.1, 0.4], [0.3, 0.7]))
+
+
+def slot_codes(slots, size: int) -> np.ndarray:
+    """
+    Normalizes time slots to an array of `TimeSlot` ordinals.
+
+    Args:
+        slots: A single TimeSlot or ordinal, or a sequence/array of either
+        size: Number of pairs the slots are broadcast against
+
+    Returns:
+        Integer array of length `size` with values in range(len(TimeSlot))
+    """
+    if isinstance(slots, TimeSlot): return np.full(size, TIME_SLOTS.index(slots), dtype=np.int8)
+    if isinstance(slots, (int, np.integer)): return np.full(size, slots, dtype=np.int8)
+    if len(slots) and isinstance(slots[0], TimeSlot): return np.array([TIME_SLOTS.index(ts) for ts in slots], dtype=np.int8)
+    return np.broadcast_to(np.asarray(slots, dtype=np.int8), (size,))
+
+
+class MeetingGraph:
+    """
+    Sparse, undirected meeting-history graph over person ids.
+
+    Adjacency is kept as fixed-width neighbour rows (a padded CSR layout, -1 = empty)
+    that widen on demand, so repeat-meeting checks scan at most `max_degree` entries.
+    Common-neighbour counts are maintained incrementally as edges are added and stored
+    as sorted pair keys, so network-effect lookups never rebuild neighbour sets.
+    All queries accept scalars or arrays.
+    """
+
+    def __init__(self, num_nodes: int, capacity: int = 4):
+        self.num_nodes = num_nodes
+        self.neighbors = np.full((num_nodes, capacity), -1, dtype=np.int64)
+        self.degree = np.zeros(num_nodes, dtype=np.int32)
+        self.common_keys = np.empty(0, dtype=np.int64)
+        self.common_counts = np.empty(0, dtype=np.int32)
+
+    @classmethod
+    def from_arrays(cls, neighbors: np.ndarray, degree: np.ndarray, common_keys: np.ndarray, common_counts: np.ndarray) -> "MeetingGraph":
+        graph = cls(0, capacity=0)
+        graph.num_nodes = len(degree)
+        graph.neighbors, graph.degree, graph.common_keys, graph.common_counts = neighbors, degree, common_keys, common_counts
+        return graph
+
+    def _pair_keys(self, a_ids: np.ndarray, b_ids: np.ndarray) -> np.ndarray:
+        return np.minimum(a_ids, b_ids) * self.num_nodes + np.maximum(a_ids, b_ids)
+
+    def neighbors_of(self, node: int) -> np.ndarray:
+        return self.neighbors[node, :self.degree[node]]
+
+    def has_edge(self, a_ids, b_ids) -> np.ndarray:
+        a_ids, b_ids = np.asarray(a_ids, dtype=np.int64), np.asarray(b_ids, dtype=np.int64)
+        return (self.neighbors[a_ids] == b_ids[..., None]).any(axis=-1)
+
+    def common_neighbors(self, a_ids, b_ids) -> np.ndarray:
+        """Counts |N(a) & N(b)| per pair; a node paired with itself counts its whole neighbourhood."""
+        a_ids, b_ids = np.asarray(a_ids, dtype=np.int64), np.asarray(b_ids, dtype=np.int64)
+        keys = self._pair_keys(a_ids, b_ids)
+        idx = np.minimum(np.searchsorted(self.common_keys, keys), max(len(self.common_keys) - 1, 0))
+        found = self.common_keys[idx] == keys if len(self.common_keys) else np.zeros(keys.shape, dtype=bool)
+        counts = np.where(found, self.common_counts[idx] if len(self.common_counts) else 0, 0)
+        return np.where(a_ids == b_ids, self.degree[a_ids], counts)
+
+    def add_edges(self, a_ids, b_ids):
+        """Adds undirected edges, ignoring self-loops and edges already present."""
+        a_ids, b_ids = np.atleast_1d(np.asarray(a_ids, dtype=np.int64)), np.atleast_1d(np.asarray(b_ids, dtype=np.int64))
+        keys = np.unique(self._pair_keys(a_ids, b_ids)[a_ids != b_ids])
+        lo, hi = keys // self.num_nodes, keys % self.num_nodes
+        new = ~self.has_edge(lo, hi)
+        if not new.any(): return
+        src, dst = np.concatenate([lo[new], hi[new]]), np.concatenate([hi[new], lo[new]])
+        order = np.argsort(src, kind="stable")
+        src, dst = src[order], dst[order]
+        old_degree = self.degree[src]
+        column = old_degree + np.arange(len(src)) - np.searchsorted(src, src)
+        if column.max() >= self.neighbors.shape[1]:
+            width = max(2 * self.neighbors.shape[1], int(column.max()) + 1)
+            self.neighbors = np.pad(self.neighbors, ((0, 0), (0, width - self.neighbors.shape[1])), constant_values=-1)
+        self.neighbors[src, column] = dst
+        self.degree += np.bincount(src, minlength=self.num_nodes).astype(np.int32)
+
+        # Every new edge x-y makes x a common neighbour of y and each other neighbour z of x.
+        # When x-z is new as well, the pair is only counted from the smaller of y and z.
+        rows = self.neighbors[src]
+        cols = np.arange(rows.shape[1])
+        valid = (cols < self.degree[src][:, None]) & (rows != dst[:, None])
+        valid &= (cols < old_degree[:, None]) | (rows > dst[:, None])
+        delta_keys, delta_counts = np.unique(self._pair_keys(np.broadcast_to(dst[:, None], rows.shape)[valid], rows[valid]), return_counts=True)
+        pos = np.searchsorted(self.common_keys, delta_keys)
+        exists = pos < len(self.common_keys)
+        exists[exists] = self.common_keys[pos[exists]] == delta_keys[exists]
+        np.add.at(self.common_counts, pos[exists], delta_counts[exists].astype(np.int32))
+        self.common_keys = np.insert(self.common_keys, pos[~exists], delta_keys[~exists])
+        self.common_counts = np.insert(self.common_counts, pos[~exists], delta_counts[~exists].astype(np.int32))
+
+
+class AttendeePopulation:
+    """
+    Struct-of-arrays storage for every attendee of a conference.
+
+    Each attribute of `Person` is held as one NumPy column indexed by person id, so
+    whole populations can be generated, scored and updated without Python loops.
+    `PersonView` objects are only created when a caller asks for a single attendee.
+    """
+
+    def __init__(self, type_codes: np.ndarray, energy: np.ndarray, introversion: np.ndarray, seniority: np.ndarray,
+                 mood: np.ndarray, meetings_had: np.ndarray, successful_connections: Optional[np.ndarray] = None,
+                 last_slot: Optional[np.ndarray] = None, meeting_graph: Optional[MeetingGraph] = None):
+        n = len(type_codes)
+        self.type_codes = type_codes
+        self.energy = energy
+        self.introversion = introversion
+        self.seniority = seniority
+        self.mood = mood
+        self.meetings_had = meetings_had
+        self.successful_connections = successful_connections if successful_connections is not None else np.zeros(n, dtype=np.int32)
+        self.last_slot = last_slot if last_slot is not None else np.full(n, -1, dtype=np.int8)
+        self.meeting_graph = meeting_graph if meeting_graph is not None else MeetingGraph(n)
+
+    @classmethod
+    def generate(cls, num_attendees: int, rng: np.random.Generator) -> "AttendeePopulation":
+        """Draws a whole population in one vectorized pass from `rng`."""
+        type_codes = rng.choice(len(PERSON_TYPES), size=num_attendees, p=_TYPE_PROBS).astype(np.int8)
+        seniority = rng.uniform(_SENIORITY_RANGE[type_codes, 0], _SENIORITY_RANGE[type_codes, 1])
+        introversion = rng.uniform(_INTROVERSION_RANGE[type_codes, 0], _INTROVERSION_RANGE[type_codes, 1])
+        return cls(type_codes=type_codes, energy=np.ones(num_attendees), introversion=introversion, seniority=seniority,
+                   mood=np.full(num_attendees, 0.5), meetings_had=np.zeros(num_attendees, dtype=np.int32))
+
+    @classmethod
+    def from_profiles(cls, profiles: List[Dict]) -> "AttendeePopulation":
+        """Builds a population from attribute dicts such as those returned by `parse_person_profile`."""
+        return cls(type_codes=np.array([_TYPE_ORDINAL[p["type"]] for p in profiles], dtype=np.int8),
+                   energy=np.array([p["energy"] for p in profiles], dtype=np.float64),
+                   introversion=np.array([p["introversion"] for p in profiles], dtype=np.float64),
+                   seniority=np.array([p["seniority"] for p in profiles], dtype=np.float64),
+                   mood=np.array([p["mood"] for p in profiles], dtype=np.float64),
+                   meetings_had=np.array([p["meetings_had"] for p in profiles], dtype=np.int32))
+
+    def __len__(self) -> int:
+        return len(self.type_codes)
+
+    def person(self, person_id: int) -> "PersonView":
+        if not 0 <= person_id < len(self): raise KeyError(person_id)
+        return PersonView(self, int(person_id))
+
+
+# Representative attribute values for the labels `PersonDescriptor` puts in its prompts.
+ENERGY_LEVELS = {"high": 0.85, "medium": 0.55, "low": 0.2}
+SOCIAL_PREFERENCES = {"introverted": 0.75, "balanced": 0.5, "extroverted": 0.25}
+EXPERIENCE_LEVELS = {"senior": 0.85, "mid-level": 0.55, "junior": 0.25}
+MOOD_LEVELS = {"positive": 0.8, "neutral": 0.5, "struggling": 0.25}
+
+
+def parse_person_profile(text: str) -> Dict:
+    """
+    Heuristically recovers simulator attributes from a person description.
+
+    Looks for a role name and the energy, social preference, experience, mood and
+    meeting-count cues `PersonDescriptor` is prompted with; anything not found falls
+    back to the middle level (or the role's typical level).
+
+    Args:
+        text: A free-text or template description of one attendee
+
+    Returns:
+        Dictionary with type, energy, introversion, seniority, mood and meetings_had
+    """
+    text = text.lower().replace("_", " ")
+    person_type = next((t for t in sorted(PERSON_TYPES, key=lambda t: -len(t.value)) if t.value.replace("_", " ") in text), PersonType.PRODUCT_MANAGER)
+    type_code = _TYPE_ORDINAL[person_type]
+    energy = re.search(r"\b(high|medium|low)\b[\s-]*energy|energy(?: level)?\W+(high|medium|low)\b", text)
+    social = re.search(r"\b(introvert|extrovert|balanced)", text)
+    mood = re.search(r"\b(positive|neutral|struggling)\b", text)
+    meetings = re.search(r"(\d+)\s+meetings?|meetings today\W+(\d+)", text)
+    experience = re.search(r"experience(?: level)?\W+(senior|junior|mid-level)|\b(senior|junior|mid)-level\b", text)
+    experience = next(g for g in experience.groups() if g) if experience else "senior" if _SENIOR_TYPES[type_code] else "junior" if _JUNIOR_TYPES[type_code] else "mid-level"
+    if experience == "mid": experience = "mid-level"
+    return {
+        "type": person_type,
+        "energy": ENERGY_LEVELS[next(g for g in energy.groups() if g)] if energy else ENERGY_LEVELS["medium"],
+        "introversion": SOCIAL_PREFERENCES[social.group(1) + "ed"] if social and social.group(1) != "balanced" else float(np.mean(_INTROVERSION_RANGE[type_code])),
+        "seniority": EXPERIENCE_LEVELS[experience],
+        "mood": MOOD_LEVELS[mood.group(1)] if mood else MOOD_LEVELS["neutral"],
+        "meetings_had": int(next(g for g in meetings.groups() if g)) if meetings else 0,
+    }
+
+
+def parse_time_slot(text: str) -> TimeSlot:
+    """Maps "Day2 Morning", "day2_morning" and similar spellings to a TimeSlot."""
+    key = re.sub(r"[\s_-]+", "_", text.strip().lower())
+    match = re.search(r"day\s*_?([1-3])_?(morning|afternoon|evening)", key)
+    if not match: raise ValueError(f"Unrecognized time slot: {text!r}")
+    return TimeSlot(f"day{match.group(1)}_{match.group(2)}")
+
+
+def _column_property(name: str, cast) -> property:
+    return property(lambda self: cast(getattr(self._pop, name)[self.id]),
+                    lambda self, value: getattr(self._pop, name).__setitem__(self.id, value))
+
+
+class PersonView:
+    """A lightweight, write-through `Person` facade over one row of an `AttendeePopulation`."""
+    __slots__ = ("_pop", "id")
+
+    def __init__(self, population: AttendeePopulation, person_id: int):
+        self._pop = population
+        self.id = person_id
+
+    type = property(lambda self: PERSON_TYPES[self._pop.type_codes[self.id]])
+    energy = _column_property("energy", float)
+    introversion = _column_property("introversion", float)
+    seniority = _column_property("seniority", float)
+    mood = _column_property("mood", float)
+    meetings_had = _column_property("meetings_had", int)
+    successful_connections = _column_property("successful_connections", int)
+
+    @property
+    def meeting_history(self) -> List[int]:
+        """Snapshot of this person's neighbours in the population's `MeetingGraph`."""
+        return self._pop.meeting_graph.neighbors_of(self.id).tolist()
+
+    @property
+    def last_meeting_time_slot(self) -> str:
+        slot = self._pop.last_slot[self.id]
+        if slot < 0: raise AttributeError("last_meeting_time_slot")
+        return TIME_SLOTS[slot].value
+
+    @last_meeting_time_slot.setter
+    def last_meeting_time_slot(self, value: str):
+        self._pop.last_slot[self.id] = TIME_SLOTS.index(TimeSlot(value))
+
+    def to_person(self) -> Person:
+        """Detaches a standalone `Person` snapshot of this row."""
+        return Person(id=self.id, type=self.type, energy=self.energy, introversion=self.introversion, seniority=self.seniority,
+                      meetings_had=self.meetings_had, successful_connections=self.successful_connections,
+                      meeting_history=list(self.meeting_history), mood=self.mood)
+
+    def __repr__(self) -> str:
+        return f"PersonView(id={self.id}, type={self.type}, energy={self.energy:.3f}, mood={self.mood:.3f})"
+
+
+class AttendeeMap(Mapping):
+    """Read-only `Dict[int, Person]` interface over a population; views are built on access."""
+
+    def __init__(self, population: AttendeePopulation):
+        self._pop = population
+
+    def __getitem__(self, person_id: int) -> PersonView:
+        return self._pop.person(person_id)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self._pop)))
+
+    def __len__(self) -> int:
+        return len(self._pop)
+
+    def __contains__(self, person_id) -> bool:
+        return isinstance(person_id, (int, np.integer)) and 0 <= person_id < len(self._pop)
+
+
+class MeetingLog:
+    """
+    Columnar, append-only record of meetings.
+
+    Columns are typed arrays that grow by doubling, and running sums of satisfaction and
+    successes are kept on append, so log-level metrics are O(1) at any point in a run.
+    Single `Meeting` appends are still accepted so the log can stand in for the old
+    `List[Meeting]`.
+    """
+    _DTYPES = {"person_a_id": np.int64, "person_b_id": np.int64, "slot_code": np.int8, "success": bool, "satisfaction": np.float64}
+
+    def __init__(self, capacity: int = 1024):
+        self._data = {name: np.empty(capacity, dtype=dtype) for name, dtype in self._DTYPES.items()}
+        self._size = 0
+        self.satisfaction_sum = 0.0
+        self.success_count = 0
+
+    def append(self, meeting: Meeting):
+        self.extend([meeting.person_a_id], [meeting.person_b_id], [TIME_SLOTS.index(meeting.time_slot)],
+                    [meeting.success], [meeting.satisfaction])
+
+    def extend(self, person_a_ids, person_b_ids, slot_codes, success, satisfaction):
+        columns = dict(zip(self._DTYPES, (person_a_ids, person_b_ids, slot_codes, success, satisfaction)))
+        n = len(columns["person_a_id"])
+        end = self._size + n
+        if end > len(self._data["person_a_id"]):
+            capacity = max(2 * len(self._data["person_a_id"]), end)
+            for name, column in self._data.items():
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:self._size] = column[:self._size]
+                self._data[name] = grown
+        for name, values in columns.items(): self._data[name][self._size:end] = values
+        self.satisfaction_sum += float(np.sum(self._data["satisfaction"][self._size:end]))
+        self.success_count += int(np.count_nonzero(self._data["success"][self._size:end]))
+        self._size = end
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, np.ndarray]) -> "MeetingLog":
+        """Wraps existing (possibly memory-mapped) columns without copying them; appends reallocate."""
+        log = cls(capacity=0)
+        log._data = {name: columns[name] for name in cls._DTYPES}
+        log._size = len(columns["person_a_id"])
+        log.satisfaction_sum = float(np.sum(log.satisfaction))
+        log.success_count = int(np.count_nonzero(log.success))
+        return log
+
+    person_a_id = property(lambda self: self._data["person_a_id"][:self._size])
+    person_b_id = property(lambda self: self._data["person_b_id"][:self._size])
+    slot_code = property(lambda self: self._data["slot_code"][:self._size])
+    success = property(lambda self: self._data["success"][:self._size])
+    satisfaction = property(lambda self: self._data["satisfaction"][:self._size])
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Meeting]:
+        for a, b, slot, success, satisfaction in zip(self.person_a_id, self.person_b_id, self.slot_code, self.success, self.satisfaction):
+            yield Meeting(int(a), int(b), TIME_SLOTS[slot], bool(success), float(satisfaction))
+
+
+def random_pairing_policy(simulator: "ConferenceSimulator", time_slot: TimeSlot, participation: float = 0.8) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pairs a random subset of attendees who still have energy left.
+
+    Args:
+        simulator: The simulator whose population is being scheduled
+        time_slot: The slot being scheduled (unused; part of the policy signature)
+        participation: Probability that an available attendee joins this slot
+
+    Returns:
+        Tuple of disjoint (a_ids, b_ids) arrays
+    """
+    available = np.flatnonzero((simulator.population.energy > 0) & (simulator.rng.random(simulator.num_attendees) < participation))
+    available = simulator.rng.permutation(available)[:len(available) // 2 * 2]
+    return available[0::2], available[1::2]
+
+
+def _factor_product(factors: Dict[str, np.ndarray]) -> np.ndarray:
+    product = factors["f_base_chem"]
+    for name in FACTOR_NAMES[1:]: product = product * factors[name]
+    return product
+
+
+def factor_attribution(factors: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-pair attribution of the success probability to each factor.
+
+    The probability is a product, so each factor's contribution is its log-ratio to the
+    factor's neutral value: positive where it raised success_prob, negative where it lowered it.
+
+    Args:
+        factors: Per-pair factor arrays keyed by FACTOR_NAMES, as from `score_pairs(return_factors=True)`
+
+    Returns:
+        Tuple of (factor matrix (n, 9), log contributions (n, 9))
+    """
+    matrix = np.column_stack([np.broadcast_to(factors[name], np.shape(factors["f_base_chem"])) for name in FACTOR_NAMES])
+    return matrix, np.log(np.maximum(matrix, 1e-12) / _FACTOR_NEUTRAL)
+
+
+def factor_reasons(contributions: np.ndarray, probability: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Dominant factor and one-word reason per pair, matching the side of 0.5 `probability` is on.
+
+    Above 0.5 the dominant factor is the one that raised success_prob the most and the
+    reason is its boost word; otherwise it is the one that lowered it the most, with its
+    drag word. Where no factor moved success_prob that way, dominant is -1 and the reason
+    falls back to the probability band.
+
+    Returns:
+        Tuple of (dominant factor index or -1 (n,), reason (n,))
+    """
+    high = np.asarray(probability) > 0.5
+    dominant = np.where(high, np.argmax(contributions, axis=1), np.argmin(contributions, axis=1))
+    moved = contributions[np.arange(len(dominant)), dominant]
+    explained = np.where(high, moved > 0, moved < 0)
+    reasons = _FACTOR_REASON_TABLE[dominant, (~high).astype(np.int64)].astype(object)
+    reasons[~explained] = [_probability_reason(p) for p in np.asarray(probability)[~explained].tolist()]
+    return np.where(explained, dominant, -1), reasons
+
+
+def _greedy_matching(u: np.ndarray, v: np.ndarray, weight: np.ndarray, num_nodes: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Greedy maximum-weight matching via locally dominant edges.
+
+    Each round matches every edge that is the heaviest remaining edge at both of its
+    endpoints, then drops edges touching matched nodes. This yields the same matching as
+    the classic sort-and-scan greedy (a 1/2-approximation) in a few vectorized rounds.
+    """
+    order = np.argsort(-weight, kind="stable")
+    u, v = u[order], v[order]
+    rank = np.arange(len(u))
+    matched = np.zeros(num_nodes, dtype=bool)
+    match_u, match_v = [], []
+    while len(u):
+        best = np.full(num_nodes, len(order))
+        np.minimum.at(best, u, rank)
+        np.minimum.at(best, v, rank)
+        dominant = (best[u] == rank) & (best[v] == rank)
+        match_u.append(u[dominant])
+        match_v.append(v[dominant])
+        matched[u[dominant]] = matched[v[dominant]] = True
+        keep = ~(matched[u] | matched[v])
+        u, v, rank = u[keep], v[keep], rank[keep]
+    return (np.concatenate(match_u), np.concatenate(match_v)) if match_u else (np.empty(0, np.int64), np.empty(0, np.int64))
+
+
+def _match_candidates(simulator: "ConferenceSimulator", ids: np.ndarray, time_slot: TimeSlot, candidates: int, pool_size: int,
+                      min_weight: float) -> Tuple[np.ndarray, np.ndarray]:
+    n = len(ids)
+    if n < 2: return np.empty(0, np.int64), np.empty(0, np.int64)
+    if pool_size >= n - 1:
+        u, v = np.triu_indices(n, k=1)
+        weight = simulator.expected_success_prob(ids[u], ids[v], time_slot)
+    else:
+        rows = np.repeat(np.arange(n), pool_size)
+        cols = (rows + 1 + simulator.rng.integers(0, n - 1, n * pool_size)) % n
+        pool_weight = simulator.expected_success_prob(ids[rows], ids[cols], time_slot).reshape(n, pool_size)
+        k = min(candidates, pool_size)
+        top = np.argpartition(-pool_weight, k - 1, axis=1)[:, :k]
+        u = np.repeat(np.arange(n), k)
+        v = cols.reshape(n, pool_size)[np.arange(n)[:, None], top].ravel()
+        weight = pool_weight[np.arange(n)[:, None], top].ravel()
+        u, v = np.minimum(u, v), np.maximum(u, v)
+        keys, first = np.unique(u * n + v, return_index=True)
+        u, v, weight = keys // n, keys % n, weight[first]
+    keep = weight > min_weight
+    match_u, match_v = _greedy_matching(u[keep], v[keep], weight[keep], n)
+    return ids[match_u], ids[match_v]
+
+
+def solve_slot_pairing(simulator: "ConferenceSimulator", time_slot: TimeSlot, candidates: int = 16, pool_size: int = 256,
+                       min_weight: float = 0.0, rounds: int = 3, available: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Chooses disjoint pairs for one slot that (approximately) maximize total expected success.
+
+    Pair weights are `expected_success_prob` from the batched scorer. With more than
+    `pool_size + 1` attendees, each attendee is scored against a random pool of
+    `pool_size` others and only its `candidates` best partners are kept before greedy
+    matching; smaller groups score every pair. Attendees left unmatched by the pruned
+    candidate set get up to `rounds - 1` further passes among themselves.
+    Usable directly as a `run_conference` policy.
+
+    Args:
+        simulator: The simulator whose population is being scheduled
+        time_slot: The slot being scheduled
+        candidates: Best partners kept per attendee after scoring its pool
+        pool_size: Random partners scored per attendee
+        min_weight: Pairs at or below this expected success are never scheduled
+        rounds: Matching passes over still-unmatched attendees
+        available: Person ids that may meet; defaults to everyone with energy left
+
+    Returns:
+        Tuple of disjoint (a_ids, b_ids) arrays
+    """
+    ids = np.flatnonzero(simulator.population.energy > 0) if available is None else np.asarray(available, dtype=np.int64)
+    matched_a, matched_b = [], []
+    for _ in range(rounds):
+        a_ids, b_ids = _match_candidates(simulator, ids, time_slot, candidates, pool_size, min_weight)
+        if not len(a_ids): break
+        matched_a.append(a_ids)
+        matched_b.append(b_ids)
+        ids = np.setdiff1d(ids, np.concatenate([a_ids, b_ids]), assume_unique=True)
+    if not matched_a: return np.empty(0, np.int64), np.empty(0, np.int64)
+    return np.concatenate(matched_a), np.concatenate(matched_b)
+
+
+def _build_type_chemistry() -> np.ndarray:
+    """Builds the symmetric PersonType x PersonType base chemistry matrix, indexed by ordinal."""
+    known_pairs = {
+        (PersonType.JUNIOR_FOUNDER, PersonType.VC_PARTNER): 0.3, (PersonType.JUNIOR_FOUNDER, PersonType.VC_ANALYST): 0.6,
+        (PersonType.SENIOR_FOUNDER, PersonType.VC_PARTNER): 0.8, (PersonType.SENIOR_FOUNDER, PersonType.VC_ANALYST): 0.5,
+        (PersonType.JUNIOR_FOUNDER, PersonType.SENIOR_ENGINEER): 0.7, (PersonType.SENIOR_FOUNDER, PersonType.SENIOR_ENGINEER): 0.6,
+        (PersonType.JUNIOR_ENGINEER, PersonType.SENIOR_ENGINEER): 0.8, (PersonType.JUNIOR_ENGINEER, PersonType.JUNIOR_ENGINEER): 0.7,
+        (PersonType.SALES_EXEC, PersonType.EXECUTIVE): 0.8, (PersonType.SALES_EXEC, PersonType.PRODUCT_MANAGER): 0.7,
+        (PersonType.RESEARCHER, PersonType.RESEARCHER): 0.9, (PersonType.RESEARCHER, PersonType.JUNIOR_ENGINEER): 0.4,
+    }
+    matrix = np.full((len(PERSON_TYPES), len(PERSON_TYPES)), 0.5)
+    np.fill_diagonal(matrix, 0.7)
+    for (type_a, type_b), chemistry in known_pairs.items():
+        matrix[_TYPE_ORDINAL[type_a], _TYPE_ORDINAL[type_b]] = matrix[_TYPE_ORDINAL[type_b], _TYPE_ORDINAL[type_a]] = chemistry
+    matrix.flags.writeable = False
+    return matrix
+
+
 class ConferenceSimulator:
-    def __init__(self, num_attendees: int = 500, seed: int = 42):
+    # Base chemistry for every (type_a, type_b) ordinal pair; gather whole pair arrays with
+    # TYPE_CHEMISTRY[type_codes_a, type_codes_b].
+    TYPE_CHEMISTRY: np.ndarray = _build_type_chemistry()
+
+    def __init__(self, num_attendees: int = 500, seed: Union[int, np.random.SeedSequence] = 42,
+                 population: Optional[AttendeePopulation] = None):
+        # All draws go through this instance's Generator; the global NumPy/`random` state is never touched,
+        # so simulators can run side by side (threads, process pools) and still reproduce exactly.
         self.seed = seed
-        np.random.seed(seed)
-        random.seed(seed)
-        self.num_attendees = num_attendees
-        self.attendees: Dict[int, Person] = self._generate_attendees()
-        self.meetings_log: List[Meeting] = []
-        self._hidden_coeffs = self._generate_hidden_coeffs(seed)
-
-    def _generate_hidden_coeffs(self, seed: int) -> Dict[str, float]:
+        self.seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        # Child (0,) of the seed sequence, derived without mutating a caller-supplied SeedSequence.
+        self.rng = np.random.default_rng(np.random.SeedSequence(self.seed_sequence.entropy, spawn_key=self.seed_sequence.spawn_key + (0,)))
+        self.num_attendees = num_attendees if population is None else len(population)
+        self.population = self._generate_attendees() if population is None else population
+        self.attendees: Mapping[int, PersonView] = AttendeeMap(self.population)
+        self.meetings_log = MeetingLog()
+        self._hidden_coeffs = self._generate_hidden_coeffs(self.seed_sequence)
+        self._recount_population_metrics()
+        self._state_version = 0
+        self._recommendation_cache: Dict[tuple, np.ndarray] = {}
+        self._recommendation_cache_version = 0
+
+    @classmethod
+    def spawn(cls, count: int, num_attendees: int = 500, seed: Union[int, np.random.SeedSequence] = 42) -> List["ConferenceSimulator"]:
+        """
+        Creates `count` statistically independent simulators from one root seed.
+
+        Args:
+            count: Number of simulators to create
+            num_attendees: Attendees per simulator
+            seed: Root seed or SeedSequence; children come from `SeedSequence.spawn`
+
+        Returns:
+            List of simulators, reproducible from the root seed
+        """
+        root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        return [cls(num_attendees=num_attendees, seed=child) for child in root.spawn(count)]
+
+    _POPULATION_COLUMNS = ("type_codes", "energy", "introversion", "seniority", "mood", "meetings_had", "successful_connections", "last_slot")
+    _GRAPH_COLUMNS = ("neighbors", "degree", "common_keys", "common_counts")
+
+    def save(self, path: str):
+        """
+        Writes a snapshot of the whole simulator to the directory `path`.
+
+        Population columns, the meeting graph and the meeting log are stored as raw `.npy`
+        files so `load(path, mmap=True)` can map them instead of reading them; seeds,
+        hidden coefficients and the RNG state go to `simulator.json`.
+        """
+        os.makedirs(path, exist_ok=True)
+        graph = self.population.meeting_graph
+        arrays = {f"population.{name}": getattr(self.population, name) for name in self._POPULATION_COLUMNS}
+        arrays.update({f"graph.{name}": getattr(graph, name) for name in self._GRAPH_COLUMNS})
+        arrays.update({f"log.{name}": getattr(self.meetings_log, name) for name in MeetingLog._DTYPES})
+        for name, array in arrays.items(): np.save(os.path.join(path, f"{name}.npy"), np.ascontiguousarray(array))
+        with open(os.path.join(path, "simulator.json"), "w") as f:
+            json.dump({
+                "seed": self.seed if isinstance(self.seed, int) else None,
+                "entropy": self.seed_sequence.entropy,
+                "spawn_key": list(self.seed_sequence.spawn_key),
+                "hidden_coeffs": self._hidden_coeffs,
+                "rng_state": self.rng.bit_generator.state,
+            }, f)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "ConferenceSimulator":
+        """
+        Restores a simulator written by `save`.
+
+        Args:
+            path: Snapshot directory
+            mmap: Map the arrays copy-on-write instead of reading them, so many workers can
+                attach to one snapshot near-instantly; local updates never touch the files
+
+        Returns:
+            The restored simulator
+        """
+        with open(os.path.join(path, "simulator.json")) as f:
+            meta = json.load(f)
+        read = lambda name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="c" if mmap else None)
+        graph = MeetingGraph.from_arrays(**{name: read(f"graph.{name}") for name in cls._GRAPH_COLUMNS})
+        population = AttendeePopulation(**{name: read(f"population.{name}") for name in cls._POPULATION_COLUMNS}, meeting_graph=graph)
+        seed_sequence = np.random.SeedSequence(meta["entropy"], spawn_key=tuple(meta["spawn_key"]))
+        simulator = cls(seed=meta["seed"] if meta["seed"] is not None else seed_sequence, population=population)
+        simulator._hidden_coeffs = meta["hidden_coeffs"]
+        simulator.rng.bit_generator.state = meta["rng_state"]
+        simulator.meetings_log = MeetingLog.from_columns({name: read(f"log.{name}") for name in MeetingLog._DTYPES})
+        return simulator
+
+    def _generate_hidden_coeffs(self, seed: Union[int, np.random.SeedSequence]) -> Dict[str, float]:
         rng = np.random.default_rng(seed)
         return {
             "energy_decay_base": rng.uniform(0.1, 0.2), "introvert_energy_multiplier": rng.uniform(1.5, 2.5),
@@ -109,38 +719,11 @@ class ConferenceSimulator:
             "day_fatigue_penalty": rng.uniform(0.05, 0.1),
         }
 
-    def _generate_attendees(self) -> Dict[int, Person]:
-        attendees = {}
-        type_distribution = {
-            PersonType.JUNIOR_FOUNDER: 0.15, PersonType.SENIOR_FOUNDER: 0.05, PersonType.JUNIOR_ENGINEER: 0.20,
-            PersonType.SENIOR_ENGINEER: 0.10, PersonType.VC_PARTNER: 0.05, PersonType.VC_ANALYST: 0.10,
-            PersonType.SALES_EXEC: 0.10, PersonType.PRODUCT_MANAGER: 0.15, PersonType.RESEARCHER: 0.05, PersonType.EXECUTIVE: 0.05,
-        }
-        for i in range(self.num_attendees):
-            person_type = np.random.choice(list(type_distribution.keys()), p=list(type_distribution.values()))
-            if "junior" in person_type.value: seniority = np.random.uniform(0.1, 0.4)
-            elif "senior" in person_type.value or "partner" in person_type.value or person_type == PersonType.EXECUTIVE: seniority = np.random.uniform(0.7, 1.0)
-            else: seniority = np.random.uniform(0.4, 0.7)
-            if person_type in [PersonType.JUNIOR_ENGINEER, PersonType.SENIOR_ENGINEER, PersonType.RESEARCHER]: introversion = np.random.uniform(0.6, 0.9)
-            elif person_type in [PersonType.SALES_EXEC]: introversion = np.random.uniform(0.1, 0.4)
-            else: introversion = np.random.uniform(0.3, 0.7)
-            attendees[i] = Person(id=i, type=person_type, energy=1.0, introversion=introversion, seniority=seniority, mood=0.5)
-        return attendees
+    def _generate_attendees(self) -> AttendeePopulation:
+        return AttendeePopulation.generate(self.num_attendees, self.rng)
     
     def _get_base_type_chemistry(self, type_a: PersonType, type_b: PersonType) -> float:
-        chemistry_matrix = {
-            (PersonType.JUNIOR_FOUNDER, PersonType.VC_PARTNER): 0.3, (PersonType.JUNIOR_FOUNDER, PersonType.VC_ANALYST): 0.6,
-            (PersonType.SENIOR_FOUNDER, PersonType.VC_PARTNER): 0.8, (PersonType.SENIOR_FOUNDER, PersonType.VC_ANALYST): 0.5,
-            (PersonType.JUNIOR_FOUNDER, PersonType.SENIOR_ENGINEER): 0.7, (PersonType.SENIOR_FOUNDER, PersonType.SENIOR_ENGINEER): 0.6,
-            (PersonType.JUNIOR_ENGINEER, PersonType.SENIOR_ENGINEER): 0.8, (PersonType.JUNIOR_ENGINEER, PersonType.JUNIOR_ENGINEER): 0.7,
-            (PersonType.SALES_EXEC, PersonType.EXECUTIVE): 0.8, (PersonType.SALES_EXEC, PersonType.PRODUCT_MANAGER): 0.7,
-            (PersonType.RESEARCHER, PersonType.RESEARCHER): 0.9, (PersonType.RESEARCHER, PersonType.JUNIOR_ENGINEER): 0.4,
-        }
-        key = tuple(sorted((type_a.value, type_b.value)))
-        mapped_key = next((k for k in chemistry_matrix if tuple(sorted((k[0].value, k[1].value))) == key), None)
-        if mapped_key: return chemistry_matrix[mapped_key]
-        if type_a == type_b: return 0.7
-        return 0.5
+        return float(self.TYPE_CHEMISTRY[_TYPE_ORDINAL[type_a], _TYPE_ORDINAL[type_b]])
 
     def _calculate_meeting_success(self, person_a: Person, person_b: Person, time_slot: TimeSlot) -> Tuple[bool, float]:
         day = int(time_slot.value.split('_')[0][-1])
@@ -154,57 +737,846 @@ class ConferenceSimulator:
         f_time_of_day = 1.0 + (self._hidden_coeffs["morning_person_bonus"] * (1 - (person_a.introversion + person_b.introversion) / 2) if time_of_day == "morning" else -self._hidden_coeffs["evening_introvert_penalty"] * ((person_a.introversion + person_b.introversion) / 2) if time_of_day == "evening" else 0)
         f_day_fatigue = 1.0 - (day - 1) * self._hidden_coeffs["day_fatigue_penalty"]
         f_seniority_mismatch = 1.0 - (self._hidden_coeffs["seniority_nervousness_penalty"] if abs(person_a.seniority - person_b.seniority) > 0.6 and ("junior" in person_a.type.value or "junior" in person_b.type.value) and time_of_day == "morning" and day == 1 else 0)
-        f_memory = self._hidden_coeffs["repeat_meeting_value_decay"] if person_b.id in person_a.meeting_history else 1.0
-        f_network_effect = 1 + len(set(person_a.meeting_history) & set(person_b.meeting_history)) * self._hidden_coeffs["network_boost_strength"]
-        success_prob = np.clip((f_base_chem * f_energy * f_mood * f_introvert_fatigue * f_time_of_day * f_day_fatigue * f_seniority_mismatch * f_memory * f_network_effect) + np.random.normal(0, self._hidden_coeffs["base_noise_std"]), 0, 1)
-        success = np.random.random() < success_prob*2
+        f_memory = self._hidden_coeffs["repeat_meeting_value_decay"] if self.population.meeting_graph.has_edge(person_a.id, person_b.id) else 1.0
+        f_network_effect = 1 + self.population.meeting_graph.common_neighbors(person_a.id, person_b.id) * self._hidden_coeffs["network_boost_strength"]
+        success_prob = np.clip((f_base_chem * f_energy * f_mood * f_introvert_fatigue * f_time_of_day * f_day_fatigue * f_seniority_mismatch * f_memory * f_network_effect) + self.rng.normal(0, self._hidden_coeffs["base_noise_std"]), 0, 1)
+        success = self.rng.random() < success_prob*2
         return success, 1-success_prob if success else success_prob
     
-    def _update_person_state(self, person: Person, meeting_success: bool, satisfaction: float, time_slot: TimeSlot):
+    def _pair_factors(self, a_ids: np.ndarray, b_ids: np.ndarray, codes: np.ndarray) -> Dict[str, np.ndarray]:
+        pop, coeffs = self.population, self._hidden_coeffs
+        type_a, type_b = pop.type_codes[a_ids], pop.type_codes[b_ids]
+        intro_a, intro_b = pop.introversion[a_ids], pop.introversion[b_ids]
+        day, is_morning, is_evening = _SLOT_DAY[codes], _SLOT_IS_MORNING[codes], _SLOT_IS_EVENING[codes]
+        evening_mult = np.where(is_evening, 1.5, 1.0)
+        penalty_a = np.exp(-pop.meetings_had[a_ids] * intro_a * coeffs["introvert_energy_multiplier"] * evening_mult)
+        penalty_b = np.exp(-pop.meetings_had[b_ids] * intro_b * coeffs["introvert_energy_multiplier"] * evening_mult)
+        avg_intro = (intro_a + intro_b) / 2
+        nervous = (np.abs(pop.seniority[a_ids] - pop.seniority[b_ids]) > 0.6) & (_JUNIOR_TYPES[type_a] | _JUNIOR_TYPES[type_b]) & is_morning & (day == 1)
+        return {
+            "f_base_chem": self.TYPE_CHEMISTRY[type_a, type_b],
+            "f_energy": 1 / (1 + np.exp(-10 * (pop.energy[a_ids] * pop.energy[b_ids] - 0.2))),
+            "f_mood": 1 / (1 + np.exp(-5 * ((pop.mood[a_ids] + pop.mood[b_ids]) / 2 - 0.5))),
+            "f_introvert_fatigue": (penalty_a + penalty_b) / 2,
+            "f_time_of_day": 1.0 + np.where(is_morning, coeffs["morning_person_bonus"] * (1 - avg_intro),
+                                            np.where(is_evening, -coeffs["evening_introvert_penalty"] * avg_intro, 0)),
+            "f_day_fatigue": 1.0 - (day - 1) * coeffs["day_fatigue_penalty"],
+            "f_seniority_mismatch": 1.0 - np.where(nervous, coeffs["seniority_nervousness_penalty"], 0),
+            "f_memory": np.where(pop.meeting_graph.has_edge(a_ids, b_ids), coeffs["repeat_meeting_value_decay"], 1.0),
+            "f_network_effect": 1 + pop.meeting_graph.common_neighbors(a_ids, b_ids) * coeffs["network_boost_strength"],
+        }
+
+    def score_pairs(self, a_ids, b_ids, slots, noise: Optional[np.ndarray] = None,
+                    uniforms: Optional[np.ndarray] = None, return_factors: bool = False) -> Tuple[np.ndarray, ...]:
+        """
+        Vectorized `_calculate_meeting_success` over whole batches of pairs.
+
+        Noise is drawn from `self.rng` as one block of normals followed by one block of
+        uniforms, so a batch of one consumes the RNG exactly like the scalar function. To replay the
+        scalar function's interleaved stream over a larger batch, pass the recorded
+        `noise` and `uniforms` draws explicitly.
+
+        Args:
+            a_ids: Person ids of the first attendee in each pair
+            b_ids: Person ids of the second attendee in each pair
+            slots: A TimeSlot, or one TimeSlot/ordinal per pair
+            noise: Optional pre-drawn N(0, base_noise_std) samples, one per pair
+            uniforms: Optional pre-drawn U[0, 1) samples, one per pair
+            return_factors: Also return the per-pair factor arrays keyed by FACTOR_NAMES
+
+        Returns:
+            Tuple of (success bool array, probability float array[, factor dict])
+        """
+        a_ids, b_ids = np.asarray(a_ids, dtype=np.int64), np.asarray(b_ids, dtype=np.int64)
+        factors = self._pair_factors(a_ids, b_ids, slot_codes(slots, len(a_ids)))
+        product = _factor_product(factors)
+        if noise is None: noise = self.rng.normal(0, self._hidden_coeffs["base_noise_std"], len(a_ids))
+        if uniforms is None: uniforms = self.rng.random(len(a_ids))
+        success_prob = np.clip(product + noise, 0, 1)
+        success = uniforms < success_prob*2
+        if return_factors: return success, np.where(success, 1-success_prob, success_prob), factors
+        return success, np.where(success, 1-success_prob, success_prob)
+
+    def score_pairs_with_attribution(self, a_ids, b_ids, slots, noise: Optional[np.ndarray] = None,
+                                     uniforms: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        `score_pairs` plus the factor vector, per-factor contributions and dominant factor of each pair.
+
+        Consumes the RNG exactly like `score_pairs`, so outcomes match for the same stream.
+        Contributions are each factor's own effect on success_prob; the dominant factor and
+        reason come from `factor_reasons`.
+
+        Returns:
+            Dictionary with success, probability, factors (n, 9), contributions (n, 9),
+            dominant (factor index, -1 for a band reason) and reason (one word per pair)
+        """
+        success, probability, factors = self.score_pairs(a_ids, b_ids, slots, noise=noise, uniforms=uniforms, return_factors=True)
+        matrix, contributions = factor_attribution(factors)
+        dominant, reasons = factor_reasons(contributions, probability)
+        return {"success": success, "probability": probability, "factors": matrix, "contributions": contributions,
+                "dominant": dominant, "reason": reasons}
+
+    def expected_success_prob(self, a_ids, b_ids, slots) -> np.ndarray:
+        """Noise-free success probability (the clipped factor product) for each pair; draws no randomness."""
+        a_ids, b_ids = np.asarray(a_ids, dtype=np.int64), np.asarray(b_ids, dtype=np.int64)
+        return np.clip(_factor_product(self._pair_factors(a_ids, b_ids, slot_codes(slots, len(a_ids)))), 0, 1)
+
+    def score_pair_all_slots(self, person_a_id: int, person_b_id: int) -> Tuple[np.ndarray, TimeSlot]:
+        """
+        Expected success of one pair in every TimeSlot, from a single vectorized call.
+
+        Returns:
+            Tuple of (probability per TimeSlot in enum order, the best TimeSlot)
+        """
+        codes = np.arange(len(TIME_SLOTS))
+        probs = self.expected_success_prob(np.full(len(codes), person_a_id), np.full(len(codes), person_b_id), codes)
+        return probs, TIME_SLOTS[int(np.argmax(probs))]
+
+    def _recommendation_key(self, person_id: int, slot_code: int, bucket_width: float) -> tuple:
+        pop = self.population
+        buckets = tuple(int(column[person_id] // bucket_width) for column in (pop.energy, pop.mood, pop.introversion, pop.seniority))
+        return (int(pop.type_codes[person_id]), int(pop.meetings_had[person_id]), *buckets, slot_code)
+
+    def invalidate_recommendations(self):
+        """Drops cached recommendations; state updates do this automatically, direct column writes must call it."""
+        self._state_version += 1
+
+    def recommend_partners(self, person_id: int, time_slot: TimeSlot, k: int = 10, use_cache: bool = True,
+                           bucket_width: float = 0.1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the k attendees with the highest expected meeting success for one person.
+
+        The person is scored against the whole population in one `expected_success_prob`
+        call and the top k are selected with argpartition. Results are cached by person
+        type, meetings had, `bucket_width`-wide buckets of energy, mood, introversion and
+        seniority, and slot, so people in the same state share one scoring pass: a hit
+        rescores the cached k + 1 candidates for the asking person. The cache
+        is invalidated by any attendee state update. People with meeting history bypass
+        the cache, since their memory and network factors are specific to them.
+
+        Args:
+            person_id: The attendee to find partners for
+            time_slot: The slot the meeting would take place in
+            k: Number of partners to return
+            use_cache: Whether to read and fill the recommendation cache
+            bucket_width: Width of the state buckets used in the cache key
+
+        Returns:
+            Tuple of (partner ids, expected success probabilities), best first
+        """
+        if self._recommendation_cache_version != self._state_version:
+            self._recommendation_cache.clear()
+            self._recommendation_cache_version = self._state_version
+        code = TIME_SLOTS.index(time_slot)
+        cacheable = use_cache and self.population.meeting_graph.degree[person_id] == 0
+        key = (self._recommendation_key(person_id, code, bucket_width), k) if cacheable else None
+        cached = self._recommendation_cache.get(key) if cacheable else None
+        if cached is not None:
+            # The cached candidates were ranked for another member of the bucket: rescore them for this person.
+            ids = cached
+            probs = self.expected_success_prob(np.full(len(ids), person_id), ids, code)
+        else:
+            # Score against everyone without masking the requester, so the k + 1 candidates still hold
+            # k partners for whichever member of the bucket asks next, including the requester's partners.
+            probs = self.expected_success_prob(np.full(self.num_attendees, person_id), np.arange(self.num_attendees), code)
+            top = min(k + 1, self.num_attendees)
+            ids = np.argpartition(-probs, top - 1)[:top] if top > 0 else np.empty(0, dtype=np.int64)
+            probs = probs[ids]
+            if cacheable: self._recommendation_cache[key] = ids
+        keep = ids != person_id
+        ids, probs = ids[keep], probs[keep]
+        order = np.argsort(-probs, kind="stable")[:k]
+        return ids[order], probs[order]
+
+    def _update_person_state(self, person: Person, meeting_success: bool, satisfaction: float, time_slot: TimeSlot,
+                             partner_id: Optional[int] = None):
+        was_burned_out, was_active = person.energy < 0.3, person.meetings_had > 0
         energy_cost = self._hidden_coeffs["energy_decay_base"] * (1 + person.introversion * self._hidden_coeffs["introvert_energy_multiplier"])
         if meeting_success and person.introversion < 0.3: energy_cost -= self._hidden_coeffs["extrovert_energy_gain_on_success"]
         person.energy = max(0, person.energy - energy_cost)
         person.meetings_had += 1
         person.mood = np.clip(person.mood * 0.7 + satisfaction * 0.3, 0, 1)
-        if meeting_success and person.id not in person.meeting_history: person.meeting_history.append(person.id)
+        if meeting_success and partner_id is not None: self.population.meeting_graph.add_edges(person.id, partner_id)
         day_current = int(time_slot.value.split('_')[0][-1])
         last_day = int(getattr(person, 'last_meeting_time_slot', time_slot.value).split('_')[0][-1])
         if day_current > last_day:
-            person.energy = min(1.0, person.energy + 0.3 + np.random.uniform(0, 0.2) * (1 - person.introversion))
-            person.mood = min(1.0, person.mood + 0.1 + np.random.uniform(0, 0.1))
+            person.energy = min(1.0, person.energy + 0.3 + self.rng.uniform(0, 0.2) * (1 - person.introversion))
+            person.mood = min(1.0, person.mood + 0.1 + self.rng.uniform(0, 0.1))
         person.last_meeting_time_slot = time_slot.value
+        self._num_burned_out += int(person.energy < 0.3) - int(was_burned_out)
+        self._num_active += int(not was_active)
+        self._state_version += 1
     
+    def _update_population_state(self, ids: np.ndarray, partner_ids: np.ndarray, meeting_success: np.ndarray,
+                                 satisfaction: np.ndarray, slot_code: int):
+        """Vectorized `_update_person_state` for attendees who each had exactly one meeting this slot."""
+        pop, coeffs = self.population, self._hidden_coeffs
+        introversion = pop.introversion[ids]
+        was_burned_out, was_active = np.count_nonzero(pop.energy[ids] < 0.3), np.count_nonzero(pop.meetings_had[ids] > 0)
+        energy_cost = coeffs["energy_decay_base"] * (1 + introversion * coeffs["introvert_energy_multiplier"])
+        energy_cost = energy_cost - np.where(meeting_success & (introversion < 0.3), coeffs["extrovert_energy_gain_on_success"], 0)
+        energy = np.maximum(0, pop.energy[ids] - energy_cost)
+        mood = np.clip(pop.mood[ids] * 0.7 + satisfaction * 0.3, 0, 1)
+        pop.meetings_had[ids] += 1
+        pop.successful_connections[ids] += meeting_success
+        pop.meeting_graph.add_edges(ids[meeting_success], partner_ids[meeting_success])
+        last_slot = pop.last_slot[ids]
+        new_day = (last_slot >= 0) & (_SLOT_DAY[last_slot] < _SLOT_DAY[slot_code])
+        rested = np.flatnonzero(new_day)
+        energy[rested] = np.minimum(1.0, energy[rested] + 0.3 + self.rng.uniform(0, 0.2, len(rested)) * (1 - introversion[rested]))
+        mood[rested] = np.minimum(1.0, mood[rested] + 0.1 + self.rng.uniform(0, 0.1, len(rested)))
+        pop.energy[ids], pop.mood[ids], pop.last_slot[ids] = energy, mood, slot_code
+        self._num_burned_out += int(np.count_nonzero(energy < 0.3)) - int(was_burned_out)
+        self._num_active += len(ids) - int(was_active)
+        self._state_version += 1
+
+    def run_conference(self, policy: Callable[["ConferenceSimulator", TimeSlot], Tuple[np.ndarray, np.ndarray]] = random_pairing_policy,
+                       time_slots: Optional[List[TimeSlot]] = None) -> Dict:
+        """
+        Drives the conference through every time slot.
+
+        Each slot, `policy(simulator, time_slot)` proposes disjoint (a_ids, b_ids) pairs; they
+        are scored in one `score_pairs` batch, attendee state is updated column-wise and
+        the meetings are appended to `meetings_log`.
+
+        Args:
+            policy: Pairing policy returning disjoint id arrays for a slot
+            time_slots: Slots to simulate, all nine TimeSlots by default
+
+        Returns:
+            Dictionary with the final metrics and a per-slot list of metrics
+        """
+        slot_metrics = []
+        for time_slot in time_slots or TIME_SLOTS:
+            a_ids, b_ids = (np.asarray(ids, dtype=np.int64) for ids in policy(self, time_slot))
+            ids = np.concatenate([a_ids, b_ids])
+            if len(np.unique(ids)) != len(ids):
+                raise ValueError(f"Policy proposed overlapping pairs for {time_slot.value}")
+            success, satisfaction, factors = self.score_pairs(a_ids, b_ids, time_slot, return_factors=True)
+            code = TIME_SLOTS.index(time_slot)
+            self._update_population_state(ids, np.concatenate([b_ids, a_ids]), np.concatenate([success, success]),
+                                          np.concatenate([satisfaction, satisfaction]), code)
+            self.meetings_log.extend(a_ids, b_ids, np.full(len(a_ids), code), success, satisfaction)
+            factor_means = {name: float(np.mean(values)) for name, values in factors.items()} if len(a_ids) else {}
+            slot_metrics.append({"time_slot": time_slot.value, "num_meetings": len(a_ids), "factor_means": factor_means, **self._calculate_metrics()})
+        return {**self._calculate_metrics(), "slots": slot_metrics}
+
+    def _recount_population_metrics(self):
+        """Recomputes the running burnout/coverage counters; call after writing population columns directly."""
+        self._num_burned_out = int(np.count_nonzero(self.population.energy < 0.3))
+        self._num_active = int(np.count_nonzero(self.population.meetings_had > 0))
+
     def _calculate_metrics(self) -> Dict:
-        if not self.meetings_log: return {"composite_score": 0}
-        active_people = [p for p in self.attendees.values() if p.meetings_had > 0]
-        if not active_people: return {"composite_score": 0}
-        avg_satisfaction = np.mean([m.satisfaction for m in self.meetings_log])
-        success_rate = np.mean([m.success for m in self.meetings_log])
-        burnout_rate = np.mean([1 for p in self.attendees.values() if p.energy < 0.3])
-        coverage = len(active_people) / self.num_attendees
+        # O(1): every term comes from a running accumulator maintained by the log and the state updates.
+        num_meetings = len(self.meetings_log)
+        if not num_meetings: return {"composite_score": 0}
+        if not self._num_active: return {"composite_score": 0}
+        avg_satisfaction = self.meetings_log.satisfaction_sum / num_meetings
+        success_rate = self.meetings_log.success_count / num_meetings
+        burnout_rate = self._num_burned_out / self.num_attendees
+        coverage = self._num_active / self.num_attendees
         return {"composite_score": float(np.clip(avg_satisfaction * 0.4 + success_rate * 0.3 + (1 - burnout_rate) * 0.2 + coverage * 0.1, 0, 1))}
 
 
 
+def _run_ensemble_member(task: Tuple[np.random.SeedSequence, int, Callable]) -> Dict[str, np.ndarray]:
+    seed_sequence, num_attendees, policy = task
+    simulator = ConferenceSimulator(num_attendees=num_attendees, seed=seed_sequence)
+    result = simulator.run_conference(policy)
+    meetings = np.array([slot["num_meetings"] for slot in result["slots"]])
+    slot_factors = np.array([[slot["factor_means"].get(name, 0.0) for name in FACTOR_NAMES] for slot in result["slots"]])
+    return {
+        "composite_score": result["composite_score"],
+        "slot_composite_score": np.array([slot["composite_score"] for slot in result["slots"]]),
+        "num_meetings": meetings.sum(),
+        "hidden_coeffs": simulator._hidden_coeffs,
+        "factor_means": meetings @ slot_factors / max(meetings.sum(), 1),
+    }
+
+
+def run_simulation_ensemble(num_conferences: int, num_attendees: int = 500, seed: int = 0, max_workers: Optional[int] = None,
+                            policy: Callable = random_pairing_policy) -> Dict:
+    """
+    Runs many independently seeded conferences across a process pool.
+
+    Seeds are spawned from one root `SeedSequence`, so the ensemble is reproducible
+    regardless of worker count or scheduling order.
+
+    Args:
+        num_conferences: Number of conferences to simulate
+        num_attendees: Attendees per conference
+        seed: Root seed for the ensemble
+        max_workers: Worker processes; None uses every core, 1 runs in-process
+        policy: Module-level (picklable) pairing policy passed to `run_conference`
+
+    Returns:
+        Dictionary of per-conference arrays (composite scores, per-slot scores, hidden
+        coefficients, mean factor values), their column names and summary statistics
+    """
+    tasks = [(child, num_attendees, policy) for child in np.random.SeedSequence(seed).spawn(num_conferences)]
+    if max_workers == 1:
+        members = [_run_ensemble_member(task) for task in tasks]
+    else:
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            members = list(executor.map(_run_ensemble_member, tasks, chunksize=max(1, num_conferences // (4 * workers))))
+    coeff_names = list(members[0]["hidden_coeffs"]) if members else []
+    for member in members: member["hidden_coeffs"] = [member["hidden_coeffs"][name] for name in coeff_names]
+    results = {key: np.array([member[key] for member in members]) for key in members[0]} if members else {}
+    scores = results.get("composite_score", np.empty(0))
+    results["coeff_names"] = coeff_names
+    results["factor_names"] = list(FACTOR_NAMES)
+    results["summary"] = {
+        "composite_score_mean": float(np.mean(scores)) if len(scores) else 0.0,
+        "composite_score_std": float(np.std(scores)) if len(scores) else 0.0,
+        "composite_score_percentiles": np.percentile(scores, [5, 25, 50, 75, 95]) if len(scores) else np.zeros(5),
+    }
+    return results
+
+
+def generate_stratified_scenarios(simulator: "ConferenceSimulator", per_bin: int, strata: Sequence[str] = ("probability", "type_pair", "slot"),
+                                  probability_bins: Sequence[float] = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0), batch_size: int = 65536,
+                                  max_batches: int = 100) -> List[Dict]:
+    """
+    Samples ground-truth scenarios that evenly fill bins of probability, type pair and slot.
+
+    Candidate pairs are drawn and scored with `score_pairs` in large batches; each batch
+    contributes only as many pairs to a bin as that bin still needs. Bins the simulator
+    cannot reach (e.g. very high probabilities for some type pairs) stay short once
+    `max_batches` is exhausted.
+
+    Args:
+        simulator: Simulator to draw attendees and ground truth from
+        per_bin: Scenarios wanted in every bin
+        strata: Any of "probability", "type_pair" (unordered) and "slot"
+        probability_bins: Bin edges for the ground-truth probability
+        batch_size: Candidate pairs scored per batch
+        max_batches: Upper bound on candidate batches
+
+    Returns:
+        Shuffled list of dicts with person_a_id, person_b_id, time_slot and ground_truth
+    """
+    num_types, n = len(PERSON_TYPES), simulator.num_attendees
+    sizes = {"probability": len(probability_bins) - 1, "type_pair": num_types * num_types, "slot": len(TIME_SLOTS)}
+    shape = [sizes[name] for name in strata]
+    need = np.full(shape, per_bin, dtype=np.int64)
+    if "type_pair" in strata:
+        # Only unordered pairs (a <= b) are real bins; mark the mirrored half as already full.
+        first, second = np.divmod(np.arange(num_types * num_types), num_types)
+        index = [slice(None)] * len(strata)
+        index[strata.index("type_pair")] = first > second
+        need[tuple(index)] = 0
+    need = need.ravel()
+    chosen = []
+    for _ in range(max_batches):
+        if not need.any(): break
+        a_ids = simulator.rng.integers(0, n, batch_size)
+        b_ids = (a_ids + 1 + simulator.rng.integers(0, n - 1, batch_size)) % n
+        codes = simulator.rng.integers(0, len(TIME_SLOTS), batch_size)
+        _, probs = simulator.score_pairs(a_ids, b_ids, codes)
+        type_a, type_b = simulator.population.type_codes[a_ids], simulator.population.type_codes[b_ids]
+        coords = {
+            "probability": np.clip(np.searchsorted(probability_bins, probs, side="right") - 1, 0, sizes["probability"] - 1),
+            "type_pair": np.minimum(type_a, type_b).astype(np.int64) * num_types + np.maximum(type_a, type_b),
+            "slot": codes,
+        }
+        bins = np.ravel_multi_index([coords[name] for name in strata], shape)
+        order = np.argsort(bins, kind="stable")
+        sorted_bins = bins[order]
+        rank = np.arange(batch_size) - np.searchsorted(sorted_bins, sorted_bins)
+        take = order[rank < need[sorted_bins]]
+        need -= np.bincount(bins[take], minlength=len(need))
+        chosen.append((a_ids[take], b_ids[take], codes[take], probs[take]))
+    if not chosen: return []
+    a_ids, b_ids, codes, probs = (np.concatenate(column) for column in zip(*chosen))
+    return [{"person_a_id": int(a_ids[i]), "person_b_id": int(b_ids[i]), "time_slot": TIME_SLOTS[codes[i]], "ground_truth": float(probs[i])}
+            for i in simulator.rng.permutation(len(a_ids))]
+
+
+def _profile_levels(pop: AttendeePopulation, ids: np.ndarray) -> np.ndarray:
+    """Discretizes attendees into the label levels `PersonDescriptor` prompts with: (n, 5) ints."""
+    energy, introversion, seniority, mood = pop.energy[ids], pop.introversion[ids], pop.seniority[ids], pop.mood[ids]
+    return np.column_stack([
+        (energy > 0.4).astype(np.int64) + (energy > 0.7),
+        (introversion >= 0.4).astype(np.int64) + (introversion > 0.6),
+        (seniority >= 0.4).astype(np.int64) + (seniority > 0.7),
+        (mood > 0.4).astype(np.int64) + (mood > 0.6),
+        np.minimum(pop.meetings_had[ids], 5),
+    ])
+
+
+class MeetingOracle:
+    """
+    Logistic model of the simulator's ground truth over discretized attendee labels.
+
+    Features are one-hot blocks over the type pair, each person's energy / social /
+    experience / mood / meeting-count labels (plus social x meetings and social x time of
+    day), the energy and mood pairs, the slot and the junior-senior day-one-morning case.
+    Person blocks are summed, so predictions are symmetric in the pair.
+    """
+    _BLOCKS = (("type_pair", 100), ("energy", 3), ("social", 3), ("experience", 3), ("mood", 3), ("meetings", 6),
+               ("social_meetings", 18), ("social_time", 9), ("energy_pair", 9), ("mood_pair", 9), ("slot", 9))
+    NUM_FEATURES = 2 + sum(size for _, size in _BLOCKS)
+
+    def __init__(self, weights: np.ndarray):
+        self.weights = np.asarray(weights, dtype=np.float64)
+
+    @classmethod
+    def features(cls, type_a: np.ndarray, type_b: np.ndarray, levels_a: np.ndarray, levels_b: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """Design matrix (n, NUM_FEATURES) from type ordinals, `_profile_levels` rows and slot ordinals."""
+        codes = np.asarray(codes, dtype=np.int64)
+        time_of_day = np.where(_SLOT_IS_MORNING[codes], 0, np.where(_SLOT_IS_EVENING[codes], 2, 1))
+        unordered = lambda a, b, size: np.minimum(a, b) * size + np.maximum(a, b)
+        person = lambda levels: [levels[:, 0], levels[:, 1], levels[:, 2], levels[:, 3], levels[:, 4],
+                                 levels[:, 1] * 6 + levels[:, 4], levels[:, 1] * 3 + time_of_day]
+        nervous = (np.abs(levels_a[:, 2] - levels_b[:, 2]) == 2) & (_SLOT_DAY[codes] == 1) & _SLOT_IS_MORNING[codes]
+        blocks = [[unordered(type_a.astype(np.int64), type_b.astype(np.int64), 10)]]
+        blocks += [[a, b] for a, b in zip(person(levels_a), person(levels_b))]
+        blocks += [[unordered(levels_a[:, 0], levels_b[:, 0], 3)], [unordered(levels_a[:, 3], levels_b[:, 3], 3)], [codes]]
+        X = np.zeros((len(codes), cls.NUM_FEATURES), dtype=np.float32)
+        X[:, 0] = 1
+        rows, offset = np.arange(len(codes)), 1
+        for (_, size), values in zip(cls._BLOCKS, blocks):
+            for column in values: np.add.at(X, (rows, offset + column), 1)
+            offset += size
+        X[:, offset] = nervous
+        return X
+
+    @classmethod
+    def fit(cls, num_conferences: int = 32, num_attendees: int = 2000, pairs_per_conference: int = 4000, seed: int = 0,
+            ridge: float = 1e-2, iterations: int = 20) -> "MeetingOracle":
+        """
+        Fits the model by Newton's method on ground truth from freshly seeded conferences.
+
+        Half the conferences are scored as generated; the other half get randomized energy,
+        mood and meeting counts so later-conference states are covered too.
+
+        Args:
+            num_conferences: Independently seeded simulators to sample (averages over hidden coefficients)
+            num_attendees: Attendees per simulator
+            pairs_per_conference: Random pairs scored per simulator
+            seed: Root seed
+            ridge: L2 penalty on the non-intercept weights
+            iterations: Newton steps
+
+        Returns:
+            A fitted MeetingOracle
+        """
+        designs, targets = [], []
+        for k, simulator in enumerate(ConferenceSimulator.spawn(num_conferences, num_attendees=num_attendees, seed=seed)):
+            pop, rng = simulator.population, simulator.rng
+            if k % 2:
+                pop.energy[:] = rng.uniform(0.05, 1, num_attendees)
+                pop.mood[:] = rng.uniform(0.1, 1, num_attendees)
+                pop.meetings_had[:] = rng.integers(0, 7, num_attendees)
+            a_ids = rng.integers(0, num_attendees, pairs_per_conference)
+            b_ids = (a_ids + 1 + rng.integers(0, num_attendees - 1, pairs_per_conference)) % num_attendees
+            codes = rng.integers(0, len(TIME_SLOTS), pairs_per_conference)
+            _, probs = simulator.score_pairs(a_ids, b_ids, codes)
+            designs.append(cls.features(pop.type_codes[a_ids], pop.type_codes[b_ids], _profile_levels(pop, a_ids), _profile_levels(pop, b_ids), codes))
+            targets.append(probs)
+        X, y = np.concatenate(designs), np.concatenate(targets)
+        penalty = np.full(cls.NUM_FEATURES, ridge * len(y))
+        penalty[0] = 0
+        weights = np.zeros(cls.NUM_FEATURES)
+        for _ in range(iterations):
+            p = 1 / (1 + np.exp(-(X @ weights)))
+            gradient = X.T @ (p - y) + penalty * weights
+            hessian = (X.T * (p * (1 - p))) @ X + np.diag(penalty + 1e-9)
+            step = np.linalg.solve(hessian, gradient)
+            weights -= step
+            if np.max(np.abs(step)) < 1e-6: break
+        return cls(weights)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return 1 / (1 + np.exp(-(X @ self.weights)))
+
+    def predict_pairs(self, population: AttendeePopulation, a_ids, b_ids, slots) -> np.ndarray:
+        """Predicted ground truth for attendees of a population, seeing only their discretized labels."""
+        a_ids, b_ids = np.asarray(a_ids, dtype=np.int64), np.asarray(b_ids, dtype=np.int64)
+        return self.predict(self.features(population.type_codes[a_ids], population.type_codes[b_ids], _profile_levels(population, a_ids),
+                                          _profile_levels(population, b_ids), slot_codes(slots, len(a_ids))))
+
+    def predict_profiles(self, profile_a: Dict, profile_b: Dict, time_slot: TimeSlot) -> float:
+        """Predicted ground truth for two `parse_person_profile` dicts."""
+        return float(self.predict_pairs(AttendeePopulation.from_profiles([profile_a, profile_b]), [0], [1], time_slot)[0])
+
+    def save(self, path: str):
+        np.save(path, self.weights)
+
+    @classmethod
+    def load(cls, path: str) -> "MeetingOracle":
+        return cls(np.load(path))
+
+
+SFT_QUESTION = 'What is the likelihood of a successful meeting? Respond with JSON: {"probability": 0.XX, "reason": "word"}'
+
+
+def build_sft_input_text(person_a_desc: str, person_b_desc: str, time_slot: TimeSlot) -> str:
+    """Formats a scenario exactly like the `input_text` column of data/sft_training_data.csv."""
+    return f"Person A: {person_a_desc}\nPerson B: {person_b_desc}\nTime: {time_slot.value.replace('_', ' ').title()}\n\n{SFT_QUESTION}"
+
+
+def _probability_reason(probability: float) -> str:
+    return "synergy" if probability > 0.7 else "engagement" if probability > 0.5 else "neutral" if probability > 0.3 else "disconnection"
+
+
+def simulator_sft_examples(descriptor, seed: int = 0, shards: Sequence[int] = (0,), num_attendees: int = 50,
+                           scenarios_per_conference: int = 16, warmup_slots: int = 0,
+                           max_conferences: Optional[int] = None, factor_reasons: bool = False) -> Iterator[Dict]:
+    """
+    Streams SFT examples generated on the fly from freshly seeded conferences.
+
+    Conference k of a shard is seeded with SeedSequence(seed, spawn_key=(shard, k)), so
+    shards never overlap and can be split across DataLoader worker processes. The
+    worker's shards are visited round-robin, one conference at a time.
+
+    Args:
+        descriptor: Any object with `generate_descriptions(batch)`, e.g. from `build_descriptor`
+        seed: Root seed for the stream
+        shards: Shard ids handled by this generator
+        num_attendees: Attendees per conference
+        scenarios_per_conference: Pairs scored from each conference before moving on
+        warmup_slots: Upper bound on the slots simulated with `run_conference` before
+            sampling, so people arrive with varied energy, mood and history. Each conference
+            draws its own warmup length from 0 to warmup_slots and scores pairs in the
+            remaining slots, so every slot (including Day 1) still appears in the stream
+        max_conferences: Conferences per shard; None streams forever
+        factor_reasons: Use the dominant simulator factor as the target reason instead of
+            a probability band (pairs no factor explains keep the band reason)
+
+    Yields:
+        Dictionaries with input_text, target_json_output, ground_truth_prob and dominant_factor
+        (None where no factor explains the pair)
+    """
+    for k in (range(max_conferences) if max_conferences is not None else count()):
+        for shard in shards:
+            simulator = ConferenceSimulator(num_attendees=num_attendees, seed=np.random.SeedSequence(seed, spawn_key=(shard, k)))
+            rng = simulator.rng
+            warmup = int(rng.integers(0, warmup_slots + 1)) if warmup_slots else 0
+            if warmup: simulator.run_conference(time_slots=TIME_SLOTS[:warmup])
+            a_ids = rng.integers(0, num_attendees, scenarios_per_conference)
+            b_ids = (a_ids + 1 + rng.integers(0, num_attendees - 1, scenarios_per_conference)) % num_attendees
+            codes = rng.integers(warmup, len(TIME_SLOTS), scenarios_per_conference)
+            scored = simulator.score_pairs_with_attribution(a_ids, b_ids, codes)
+            descriptions = descriptor.generate_descriptions([(simulator.attendees[person], TIME_SLOTS[code])
+                                                             for pair in zip(a_ids.tolist(), b_ids.tolist(), codes.tolist())
+                                                             for person, code in ((pair[0], pair[2]), (pair[1], pair[2]))])
+            for a_desc, b_desc, code, prob, dominant, reason in zip(descriptions[::2], descriptions[1::2], codes.tolist(), scored["probability"].tolist(),
+                                                                    scored["dominant"].tolist(), scored["reason"].tolist()):
+                input_text = build_sft_input_text(a_desc, b_desc, TIME_SLOTS[code])
+                yield {
+                    "input_text": input_text,
+                    "target_json_output": {"probability": round(prob, 2), "reason": reason if factor_reasons else _probability_reason(prob)},
+                    "ground_truth_prob": prob,
+                    "dominant_factor": FACTOR_NAMES[dominant] if dominant >= 0 else None,
+                }
+
+
+class DescriptionCache:
+    """
+    On-disk SQLite cache of LLM descriptions keyed by a hash of the prompt and LLM options,
+    plus a variant index.
+
+    Holds at most `max_entries` rows; inserting past that evicts the least recently
+    used rows. Safe to share between threads, and pickles by path so DataLoader worker
+    processes reopen their own connection.
+    """
+    def __init__(self, path: str = "data/description_cache.sqlite", max_entries: int = 200_000):
+        self.path = path
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        return {"path": self.path, "max_entries": self.max_entries}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @staticmethod
+    def key(prompt: str, options: Optional[Mapping] = None) -> str:
+        """Hash of the prompt and the LLM options (model, provider, temperature, ...) that answer it."""
+        payload = prompt if not options else prompt + "\0" + json.dumps(options, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if os.path.dirname(self.path): os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS descriptions (key TEXT NOT NULL, variant INTEGER NOT NULL, text TEXT NOT NULL, "
+                               "last_used REAL NOT NULL, PRIMARY KEY (key, variant))")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS descriptions_last_used ON descriptions (last_used)")
+            self._size = self._conn.execute("SELECT COUNT(*) FROM descriptions").fetchone()[0]
+        return self._conn
+
+    def get(self, key: str, variant: int) -> Optional[str]:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute("SELECT text FROM descriptions WHERE key = ? AND variant = ?", (key, variant)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            conn.execute("UPDATE descriptions SET last_used = ? WHERE key = ? AND variant = ?", (time.time(), key, variant))
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, variant: int, text: str):
+        with self._lock:
+            conn = self._connection()
+            exists = conn.execute("SELECT 1 FROM descriptions WHERE key = ? AND variant = ?", (key, variant)).fetchone() is not None
+            conn.execute("INSERT OR REPLACE INTO descriptions VALUES (?, ?, ?, ?)", (key, variant, text, time.time()))
+            self._size += not exists
+            if self._size > self.max_entries:
+                self._size = conn.execute("SELECT COUNT(*) FROM descriptions").fetchone()[0]
+                excess = self._size - self.max_entries
+                if excess > 0:
+                    conn.execute("DELETE FROM descriptions WHERE rowid IN (SELECT rowid FROM descriptions ORDER BY last_used LIMIT ?)", (excess,))
+                    self._size -= excess
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM descriptions").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None: self._conn.close()
+            self._conn = None
+
+
+def npcpy_get_llm_response(prompt: str, **kwargs) -> Dict:
+    """Calls npcpy's `get_llm_response`, imported on first use so the simulator runs without npcpy."""
+    from npcpy.llm_funcs import get_llm_response
+    return get_llm_response(prompt, **kwargs)
+
+
+def extract_json_object(text: str) -> dict:
+    """
+    Parses the first JSON object in `text`, skipping code fences or prose around it.
+
+    Unlike `safe_extract_json` this expects no particular keys and does not print.
+
+    Raises:
+        ValueError: If `text` contains no parseable JSON object
+    """
+    decoder = json.JSONDecoder()
+    for match in re.finditer(r"\{", text):
+        try:
+            parsed, _ = decoder.raw_decode(text, match.start())
+        except ValueError:
+            continue
+        if isinstance(parsed, dict): return parsed
+    raise ValueError(f"No JSON object found in response: {text[:200]!r}")
+
+
 class PersonDescriptor:
-    def __init__(self, temperature: float = 0.8):
+    def __init__(self, temperature: float = 0.8, cache: Optional[DescriptionCache] = None, variants_per_key: int = 4,
+                 seed: Optional[int] = None, people_per_prompt: int = 1, llm_kwargs: Optional[Dict] = None):
+        """
+        Args:
+            temperature: Sampling temperature for the LLM
+            cache: Optional persistent cache; each prompt keeps up to `variants_per_key`
+                descriptions and a request picks one of those slots at random, calling
+                the LLM only when the slot is still empty
+            variants_per_key: Distinct cached descriptions per prompt
+            seed: Seed for the variant choice
+            people_per_prompt: Attendees `generate_descriptions` describes per LLM call, as
+                one JSON list; people missing from a short or malformed reply fall back to
+                their own single-person call
+            llm_kwargs: Extra arguments for the LLM call, e.g. model and provider; they are
+                part of the cache key, so switching models does not reuse old descriptions
+        """
         self.temperature = temperature
-    
-    def generate_description(self, person: Person, time_slot: TimeSlot) -> str:
-        """Convert person attributes to natural language description"""
-        prompt = f"""Describe this conference attendee's current state in 1-2 sentences based on their situation:
+        self.cache = cache
+        self.variants_per_key = variants_per_key
+        self.rng = np.random.default_rng(seed)
+        self.people_per_prompt = people_per_prompt
+        self.llm_kwargs = llm_kwargs or {}
+        self.llm_options = {"temperature": self.temperature, **self.llm_kwargs}
 
-Role: {person.type.value.replace('_', ' ').title()}
+    @staticmethod
+    def _profile_lines(person: Person, time_slot: TimeSlot) -> str:
+        return f"""Role: {person.type.value.replace('_', ' ').title()}
 Current energy level: {'High' if person.energy > 0.7 else 'Medium' if person.energy > 0.4 else 'Low'}
 Social preference: {'Introverted' if person.introversion > 0.6 else 'Extroverted' if person.introversion < 0.4 else 'Balanced'}
 Experience level: {'Senior' if person.seniority > 0.7 else 'Junior' if person.seniority < 0.4 else 'Mid-level'}
 Meetings today: {person.meetings_had}
 Time: {time_slot.value.replace('_', ' ').title()}
-Mood: {'Positive' if person.mood > 0.6 else 'Neutral' if person.mood > 0.4 else 'Struggling'}
+Mood: {'Positive' if person.mood > 0.6 else 'Neutral' if person.mood > 0.4 else 'Struggling'}"""
+
+    def build_prompt(self, person: Person, time_slot: TimeSlot) -> str:
+        return f"""Describe this conference attendee's current state in 1-2 sentences based on their situation:
+
+{self._profile_lines(person, time_slot)}
 
 Write a brief description of how this person appears and behaves right now."""
-        
-        return npcpy_get_llm_response(prompt, temperature=0.9).get('response')
+
+    def build_group_prompt(self, batch: Sequence[Tuple[Person, TimeSlot]]) -> str:
+        profiles = "\n\n".join(f"Attendee {i + 1}:\n{self._profile_lines(person, time_slot)}" for i, (person, time_slot) in enumerate(batch))
+        return f"""Describe each of these {len(batch)} conference attendees' current state in 1-2 sentences based on their situation:
+
+{profiles}
+
+For each attendee, write a brief description of how this person appears and behaves right now.
+Return a single JSON object like {{"descriptions": ["attendee 1 description", "attendee 2 description"]}} with exactly {len(batch)} strings, in attendee order."""
+
+    def _describe(self, prompt: str) -> str:
+        return npcpy_get_llm_response(prompt, **self.llm_options).get('response')
+
+    def _describe_group(self, batch: Sequence[Tuple[Person, TimeSlot]]) -> List[str]:
+        """Describes several people with one LLM call, falling back per person for anything missing."""
+        if len(batch) == 1: return [self._describe(self.build_prompt(*batch[0]))]
+        response = npcpy_get_llm_response(self.build_group_prompt(batch), format='json', **self.llm_options).get('response')
+        try:
+            parsed = response if isinstance(response, dict) else extract_json_object(response or "")
+        except ValueError:
+            parsed = None
+        descriptions = parsed.get("descriptions") if isinstance(parsed, dict) else None
+        if not isinstance(descriptions, list): descriptions = []
+        return [descriptions[i].strip() if i < len(descriptions) and isinstance(descriptions[i], str) and descriptions[i].strip()
+                else self._describe(self.build_prompt(person, time_slot)) for i, (person, time_slot) in enumerate(batch)]
+
+    def generate_description(self, person: Person, time_slot: TimeSlot) -> str:
+        """Convert person attributes to natural language description"""
+        prompt = self.build_prompt(person, time_slot)
+        if self.cache is None:
+            return self._describe(prompt)
+        key, variant = DescriptionCache.key(prompt, self.llm_options), int(self.rng.integers(self.variants_per_key))
+        description = self.cache.get(key, variant)
+        if description is None:
+            description = self._describe(prompt)
+            self.cache.put(key, variant, description)
+        return description
+
+    async def agenerate_descriptions(self, batch: Sequence[Tuple[Person, TimeSlot]], max_concurrency: int = 8) -> List[str]:
+        """
+        Describes a batch of (person, time_slot) pairs concurrently.
+
+        Cache hits are served first; the remaining people are grouped `people_per_prompt`
+        at a time, and each blocking LLM call runs in a worker thread while a semaphore
+        keeps at most `max_concurrency` requests in flight against the local endpoint.
+
+        Returns:
+            Descriptions in the same order as `batch`
+        """
+        descriptions: List[Optional[str]] = [None] * len(batch)
+        slots = [None] * len(batch)
+        if self.cache is not None:
+            for i, (person, time_slot) in enumerate(batch):
+                slots[i] = (DescriptionCache.key(self.build_prompt(person, time_slot), self.llm_options), int(self.rng.integers(self.variants_per_key)))
+                descriptions[i] = self.cache.get(*slots[i])
+        pending = [i for i, description in enumerate(descriptions) if description is None]
+        semaphore = asyncio.Semaphore(max_concurrency)
+        async def describe(group: List[int]):
+            async with semaphore:
+                results = await asyncio.to_thread(self._describe_group, [batch[i] for i in group])
+            for i, description in zip(group, results):
+                descriptions[i] = description
+                if self.cache is not None: self.cache.put(*slots[i], description)
+        await asyncio.gather(*(describe(pending[start:start + self.people_per_prompt]) for start in range(0, len(pending), self.people_per_prompt)))
+        return descriptions
+
+    def generate_descriptions(self, batch: Sequence[Tuple[Person, TimeSlot]], max_concurrency: int = 8) -> List[str]:
+        """
+        Blocking wrapper around `agenerate_descriptions` for synchronous callers.
+
+        Inside a running event loop (e.g. a Jupyter cell) `asyncio.run` cannot nest, so the
+        coroutine gets its own loop in a worker thread instead.
+        """
+        coroutine = self.agenerate_descriptions(batch, max_concurrency)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+def _phrase_table(rows: List[List[str]]) -> np.ndarray:
+    return np.array(rows, dtype=object)
+
+
+class TemplatePersonDescriptor:
+    """
+    LLM-free descriptor that assembles descriptions from a combinatorial phrase bank.
+
+    Each description combines one phrase variant for the role, experience, energy, social
+    preference and mood levels `PersonDescriptor` prompts with, so `parse_person_profile`
+    recovers the same labels. Variants are drawn from a seeded generator and whole
+    populations are described with array indexing.
+    """
+    ROLES = _phrase_table([[f"This {label}", f"The {label}", f"One {label}"]
+                           for label in (t.value.replace('_', ' ').replace('vc', 'VC') for t in PERSON_TYPES)])
+    # Rows follow the `_profile_levels` codes: low/medium/high energy, extroverted/balanced/introverted,
+    # junior/mid-level/senior experience and struggling/neutral/positive mood.
+    EXPERIENCE = _phrase_table([[f", with {level}-level experience,", f", bringing {level}-level experience,", f" of {level}-level experience"]
+                                for level in ("junior", "mid", "senior")])
+    ENERGY = _phrase_table([[f"is running on {level} energy", f"shows {level} energy", f"has {level} energy right now"]
+                            for level in ("low", "medium", "high")])
+    SOCIAL = _phrase_table([["comes across as extroverted and chatty", "is an outgoing extrovert", "is clearly extroverted"],
+                            ["seems socially balanced", "is balanced between listening and talking", "strikes a balanced social tone"],
+                            ["comes across as introverted and reserved", "is a quiet introvert", "is noticeably introverted"]])
+    MOOD = _phrase_table([["They look like they are struggling", "They seem to be struggling a little", "They are visibly struggling"],
+                          ["Their mood is neutral", "They seem neutral overall", "They come across as neutral"],
+                          ["Their mood is positive", "They seem upbeat and positive", "They are in a positive mood"]])
+    SLOTS = _phrase_table([f" during the {ts.value.replace('_', ' ').title()} slot after " for ts in TIME_SLOTS])
+
+    def __init__(self, seed: Optional[int] = 0):
+        self.rng = np.random.default_rng(seed)
+
+    def describe_arrays(self, type_codes: np.ndarray, energy: np.ndarray, introversion: np.ndarray, seniority: np.ndarray,
+                        mood: np.ndarray, meetings_had: np.ndarray, slots) -> List[str]:
+        """Describes attendees given as attribute arrays; `slots` is a TimeSlot or one slot/ordinal per attendee."""
+        population = AttendeePopulation(np.asarray(type_codes), np.asarray(energy, dtype=np.float64), np.asarray(introversion, dtype=np.float64),
+                                        np.asarray(seniority, dtype=np.float64), np.asarray(mood, dtype=np.float64),
+                                        np.asarray(meetings_had), meeting_graph=MeetingGraph(0))
+        return self.describe_population(population, np.arange(len(population)), slots)
+
+    def describe_population(self, population: AttendeePopulation, ids, slots) -> List[str]:
+        """Describes `population` rows `ids`; `slots` is a TimeSlot or one slot/ordinal per id."""
+        ids = np.asarray(ids, dtype=np.int64)
+        levels = _profile_levels(population, ids)
+        variant = self.rng.integers(0, self.ROLES.shape[1], size=(5, len(ids)))
+        meetings = population.meetings_had[ids]
+        counts = _phrase_table([f"{n} meeting{'' if n == 1 else 's'} today." for n in range(int(meetings.max(initial=0)) + 1)])
+        text = (self.ROLES[population.type_codes[ids], variant[0]] + self.EXPERIENCE[levels[:, 2], variant[1]] + " "
+                + self.ENERGY[levels[:, 0], variant[2]] + " and " + self.SOCIAL[levels[:, 1], variant[3]] + ". "
+                + self.MOOD[levels[:, 3], variant[4]] + self.SLOTS[slot_codes(slots, len(ids))] + counts[meetings])
+        return text.tolist()
+
+    def generate_description(self, person: Person, time_slot: TimeSlot) -> str:
+        """Convert person attributes to natural language description"""
+        return self.describe_arrays([_TYPE_ORDINAL[person.type]], [person.energy], [person.introversion], [person.seniority],
+                                    [person.mood], [person.meetings_had], time_slot)[0]
+
+    def generate_descriptions(self, batch: Sequence[Tuple[Person, TimeSlot]], max_concurrency: int = 8) -> List[str]:
+        """Describes a batch of (person, time_slot) pairs in one vectorized pass."""
+        if not batch: return []
+        people, slots = zip(*batch)
+        return self.describe_arrays([_TYPE_ORDINAL[p.type] for p in people], [p.energy for p in people], [p.introversion for p in people],
+                                    [p.seniority for p in people], [p.mood for p in people], [p.meetings_had for p in people], list(slots))
+
+    async def agenerate_descriptions(self, batch: Sequence[Tuple[Person, TimeSlot]], max_concurrency: int = 8) -> List[str]:
+        return self.generate_descriptions(batch)
+
+
+def build_descriptor(kind: str = "llm", seed: Optional[int] = None) -> Union[PersonDescriptor, TemplatePersonDescriptor]:
+    """
+    Builds the descriptor a pipeline is configured with.
+
+    Args:
+        kind: "llm" for a cached `PersonDescriptor`, or "template" for `TemplatePersonDescriptor`
+        seed: Seed for variant choices
+
+    Returns:
+        A descriptor with `generate_description` and `generate_descriptions`
+    """
+    if kind == "llm": return PersonDescriptor(temperature=0.8, cache=DescriptionCache(), seed=seed)
+    if kind == "template": return TemplatePersonDescriptor(seed=seed)
+    raise ValueError(f"Unknown descriptor kind: {kind!r} (expected 'llm' or 'template')")
+
 
 # Add training metrics tracking
 @dataclass 
@@ -219,17 +1591,101 @@ class TrainingMetrics:
 
 
 
+PROBABILITY_PREFIX = '{"probability": 0.'
+INFERENCE_PRECISIONS = ("float32", "bfloat16", "int8")
+
+
+def apply_inference_precision(model: "torch.nn.Module", precision: str = "float32") -> "torch.nn.Module":
+    """
+    Prepares a merged (non-PEFT) causal LM for CPU inference at the given precision.
+
+    "bfloat16" casts all weights, halving memory and bandwidth; "int8" applies dynamic
+    int8 quantization to every nn.Linear (int8 weights, activations quantized on the
+    fly) and moves the model to CPU, the only device it supports. "float32" is a no-op.
+    """
+    if precision not in INFERENCE_PRECISIONS: raise ValueError(f"Unknown precision: {precision!r} (expected one of {INFERENCE_PRECISIONS})")
+    import torch
+    if precision == "bfloat16": return model.to(torch.bfloat16)
+    if precision == "int8": return torch.ao.quantization.quantize_dynamic(model.to("cpu"), {torch.nn.Linear}, dtype=torch.qint8)
+    return model
+
+
 class MeetingPredictor:
-    def __init__(self, model_path: str):
+    def __init__(self, model_path: str, readout: str = "generate", precision: str = "float32", cache_size: int = 0,
+                 cache_sampled: bool = False):
+        """
+        Args:
+            model_path: Path to the trained LoRA adapter
+            readout: "generate" samples a JSON answer and parses it; "logits" reads the
+                probability from the digit distribution after PROBABILITY_PREFIX, with the
+                reason taken from its probability band
+            precision: One of INFERENCE_PRECISIONS; anything but "float32" merges the
+                adapter into the base model first, see `apply_inference_precision`
+            cache_size: Results `predict` keeps in an LRU cache keyed by the normalized
+                inputs and adapter identity; 0 disables it
+            cache_sampled: Also cache the sampled "generate" readout, whose outputs vary
+                between calls; by default only the deterministic "logits" readout is cached
+        """
+        if readout not in ("generate", "logits"): raise ValueError(f"Unknown readout: {readout!r} (expected 'generate' or 'logits')")
+        self.readout = readout
+        self.identity = PredictorRegistry.adapter_key(model_path) + (readout, precision)
+        self.cache_size = cache_size
+        self.cache_sampled = cache_sampled
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache: "OrderedDict[str, dict]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        from peft import PeftModel
+        from transformers import AutoModelForCausalLM, AutoTokenizer
         self.tokenizer = AutoTokenizer.from_pretrained('google/gemma-3-270m-it', trust_remote_code=True)
         self.tokenizer.pad_token = self.tokenizer.eos_token
         
         base_model = AutoModelForCausalLM.from_pretrained('google/gemma-3-270m-it', trust_remote_code=True)
         self.model = PeftModel.from_pretrained(base_model, model_path)
+        if precision != "float32":
+            self.model = apply_inference_precision(self.model.merge_and_unload(), precision)
+        self.precision = precision
     
-    def predict(self, person_a_desc: str, person_b_desc: str, time_slot: str) -> dict:
+    @staticmethod
+    def chat_prompt(person_a_desc: str, person_b_desc: str, time_slot: str) -> str:
         prompt = f"Person A: {person_a_desc}. Person B: {person_b_desc}. Time: {time_slot}. What is the likelihood of a successful meeting? Respond with JSON: {{\"probability\": 0.XX, \"reason\": \"word\"}}"
-        test = f'<start_of_turn>user\n{prompt}<end_of_turn>\n<start_of_turn>model\n'
+        return f'<start_of_turn>user\n{prompt}<end_of_turn>\n<start_of_turn>model\n'
+
+    def _cache_key(self, person_a_desc: str, person_b_desc: str, time_slot: str) -> str:
+        normalized = [" ".join(person_a_desc.split()), " ".join(person_b_desc.split()), " ".join(time_slot.split()).lower()]
+        return hashlib.sha256(json.dumps([*self.identity, *normalized]).encode("utf-8")).hexdigest()
+
+    def cache_info(self) -> Dict[str, int]:
+        return {"hits": self.cache_hits, "misses": self.cache_misses, "size": len(self._cache), "max_size": self.cache_size}
+
+    def clear_cache(self):
+        with self._cache_lock:
+            self._cache.clear()
+            self.cache_hits = self.cache_misses = 0
+
+    def predict(self, person_a_desc: str, person_b_desc: str, time_slot: str) -> dict:
+        """Predicts one meeting, served from the LRU cache when enabled and the readout is deterministic (or `cache_sampled`)."""
+        if self.cache_size <= 0 or (self.readout == "generate" and not self.cache_sampled):
+            return self._predict(person_a_desc, person_b_desc, time_slot)
+        key = self._cache_key(person_a_desc, person_b_desc, time_slot)
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return dict(self._cache[key])
+            self.cache_misses += 1
+        result = self._predict(person_a_desc, person_b_desc, time_slot)
+        with self._cache_lock:
+            self._cache[key] = dict(result)
+            if len(self._cache) > self.cache_size: self._cache.popitem(last=False)
+        return result
+
+    def _predict(self, person_a_desc: str, person_b_desc: str, time_slot: str) -> dict:
+        if self.readout == "logits":
+            probability = round(float(self.predict_probability_batch([(person_a_desc, person_b_desc, time_slot)])[0]), 4)
+            return {"probability": probability, "reason": _probability_reason(probability)}
+        import torch
+        test = self.chat_prompt(person_a_desc, person_b_desc, time_slot)
         
         inputs = self.tokenizer(test, return_tensors='pt', truncation=True, max_length=512)
         
@@ -246,6 +1702,140 @@ class MeetingPredictor:
         json_part = result.split("model")[-1].strip()
         return json.loads(json_part)
 
+    def predict_batch(self, examples: Sequence[Tuple[str, str, str]], batch_size: int = 8, max_new_tokens: int = 50,
+                      do_sample: bool = True, temperature: float = 0.1) -> List[Optional[dict]]:
+        """
+        Predicts many (person_a_desc, person_b_desc, time_slot) triples with one `generate` call per batch.
+
+        Prompts are left-padded per call, leaving the shared tokenizer's padding side alone,
+        so every sequence in a batch ends where generation starts.
+
+        Returns:
+            One parsed JSON dict per example, or None where the output was not a JSON object
+        """
+        import torch
+        results: List[Optional[dict]] = []
+        sampling = {"do_sample": True, "temperature": temperature} if do_sample else {"do_sample": False}
+        for start in range(0, len(examples), batch_size):
+            prompts = [self.chat_prompt(*example) for example in examples[start:start + batch_size]]
+            inputs = self.tokenizer(prompts, return_tensors='pt', truncation=True, max_length=512, padding=True, padding_side="left")
+            with torch.no_grad():
+                outputs = self.model.generate(**inputs, max_new_tokens=max_new_tokens, pad_token_id=self.tokenizer.eos_token_id, **sampling)
+            for text in self.tokenizer.batch_decode(outputs[:, inputs['input_ids'].shape[1]:], skip_special_tokens=True):
+                try:
+                    parsed = json.loads(text.strip())
+                except ValueError:
+                    parsed = None
+                results.append(parsed if isinstance(parsed, dict) else None)
+        return results
+
+    def _digit_token_ids(self) -> "torch.Tensor":
+        if getattr(self, "_digit_ids", None) is None:
+            import torch
+            ids = [self.tokenizer.encode(str(d), add_special_tokens=False) for d in range(10)]
+            if any(len(i) != 1 for i in ids): raise ValueError("Logit readout needs a tokenizer that encodes each digit as one token")
+            self._digit_ids = torch.tensor([i[0] for i in ids])
+        return self._digit_ids
+
+    def predict_probability_batch(self, examples: Sequence[Tuple[str, str, str]], batch_size: int = 8, digits: int = 2) -> np.ndarray:
+        """
+        Expected probability from the model's digit distribution, without sampling or JSON parsing.
+
+        The chat prompt is extended with PROBABILITY_PREFIX and one forward pass gives the
+        first-decimal distribution. With digits=2 a second, single-token pass over the
+        cached prompt (repeated once per first digit) adds the second decimal.
+
+        Returns:
+            Array of expected probabilities, one per example
+        """
+        import torch
+        digit_ids = self._digit_token_ids()
+        values = torch.arange(10, dtype=torch.float32)
+        expected = []
+        for start in range(0, len(examples), batch_size):
+            prompts = [self.chat_prompt(*example) + PROBABILITY_PREFIX for example in examples[start:start + batch_size]]
+            inputs = self.tokenizer(prompts, return_tensors='pt', truncation=True, max_length=512, padding=True, padding_side="left")
+            mask = inputs['attention_mask']
+            # Positions count real tokens only, as `generate` does, so left padding does not shift them.
+            positions = (mask.cumsum(-1) - 1).clamp(min=0)
+            with torch.no_grad():
+                out = self.model(input_ids=inputs['input_ids'], attention_mask=mask, position_ids=positions, use_cache=digits > 1)
+                first = torch.softmax(out.logits[:, -1, digit_ids].float(), dim=-1)
+                value = first @ values / 10
+                if digits > 1:
+                    n = len(prompts)
+                    cache = out.past_key_values
+                    cache.batch_repeat_interleave(10)
+                    out = self.model(input_ids=digit_ids.repeat(n)[:, None],
+                                     attention_mask=torch.cat([mask.repeat_interleave(10, dim=0), torch.ones(n * 10, 1, dtype=mask.dtype)], dim=1),
+                                     position_ids=positions[:, -1:].repeat_interleave(10, dim=0) + 1, past_key_values=cache)
+                    second = torch.softmax(out.logits[:, -1, digit_ids].float(), dim=-1).view(n, 10, 10)
+                    value = value + (first * (second @ values)).sum(dim=1) / 100
+            expected.append(value.numpy())
+        return np.concatenate(expected) if expected else np.empty(0)
+
+
+class PredictorRegistry:
+    """
+    Process-wide cache of loaded MeetingPredictors keyed by (adapter path, adapter mtime).
+
+    Each adapter version (and set of predictor options, such as `readout`) is loaded once per process. Concurrent requests for the same
+    adapter wait on a single load, and rewriting the adapter on disk (a new training run)
+    makes the next request load the fresh weights and drop the stale predictor.
+    """
+    def __init__(self, factory: Callable[..., MeetingPredictor] = MeetingPredictor):
+        self.factory = factory
+        self.load_seconds: Dict[Tuple, float] = {}
+        self._predictors: Dict[Tuple, MeetingPredictor] = {}
+        self._path_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def adapter_key(model_path: str) -> Tuple[str, float]:
+        """(absolute path, newest mtime of the adapter directory or any file in it)."""
+        path = os.path.abspath(model_path)
+        if not os.path.isdir(path): return path, os.path.getmtime(path) if os.path.exists(path) else 0.0
+        return path, max([os.path.getmtime(path)] + [os.path.getmtime(entry.path) for entry in os.scandir(path)])
+
+    def get(self, model_path: str, **options) -> MeetingPredictor:
+        key = self.adapter_key(model_path) + tuple(sorted(options.items()))
+        predictor = self._predictors.get(key)
+        if predictor is not None: return predictor
+        with self._lock:
+            path_lock = self._path_locks.setdefault(key[0], threading.Lock())
+        with path_lock:
+            predictor = self._predictors.get(key)
+            if predictor is None:
+                start = time.perf_counter()
+                predictor = self.factory(model_path, **options)
+                with self._lock:
+                    for stale in [k for k in self._predictors if k[0] == key[0] and k[1] != key[1]]: del self._predictors[stale]
+                    self._predictors[key] = predictor
+                    self.load_seconds[key] = time.perf_counter() - start
+        return predictor
+
+    def preload(self, model_paths: Sequence[str], **options) -> Dict[str, float]:
+        """Loads predictors up front, e.g. at startup, and returns the seconds each load took."""
+        timings = {}
+        for model_path in model_paths:
+            self.get(model_path, **options)
+            timings[model_path] = self.load_seconds.get(self.adapter_key(model_path) + tuple(sorted(options.items())), 0.0)
+            print(f"Loaded MeetingPredictor from {model_path} in {timings[model_path]:.2f}s")
+        return timings
+
+    def clear(self):
+        with self._lock:
+            self._predictors.clear()
+            self.load_seconds.clear()
+
+
+predictor_registry = PredictorRegistry()
+
+
+def get_meeting_predictor(model_path: str, **options) -> MeetingPredictor:
+    """The process-wide predictor for `model_path` (and MeetingPredictor `options`), loaded on first use."""
+    return predictor_registry.get(model_path, **options)
+
 
 def safe_extract_json(response_text: str) -> dict:
     """Extract and parse JSON with proper error handling"""
@@ -292,8 +1882,8 @@ def safe_extract_json(response_text: str) -> dict:
     
 
 def run_local_agent_evaluation(
-    model: AutoModelForCausalLM,
-    tokenizer: AutoTokenizer,
+    model: "AutoModelForCausalLM",
+    tokenizer: "AutoTokenizer",
     test_scenarios: List[Dict],
     model_type: str
 ) -> List[Dict]:
@@ -310,6 +1900,7 @@ def run_local_agent_evaluation(
         List of evaluation result dictionaries
     """
 
+    import torch
     print(f"\n Running Full Local Evaluation for {model_type.upper()} Model ")
     results = []
     def custom_llm_response(prompt, 
@@ -13,29 +13,30 @@ import torch
 from transformers import AutoModelForCausalLM, AutoTokenizer
 from typing import Dict, Any, List, Optional, Any
 from starter_agentic_traces import TOOLS, system_prompt_configurations, AgentToolLoop
-from data_classes import  get_true_outcome, calculate_accuracy_metrics, PersonDescriptor, TimeSlot, ConferenceSimulator
+from data_classes import  get_true_outcome, calculate_accuracy_metrics, TimeSlot, ConferenceSimulator, build_descriptor, apply_inference_precision
 from npcpy.npc_compiler import NPC
 
 
 
 
-def load_trained_model(base_model_id: str, adapter_path: Optional[str]):
+def load_trained_model(base_model_id: str, adapter_path: Optional[str], precision: str = "float32"):
     """
     Loads a model with optional LoRA adapter.
     
     Args:
         base_model_id: The base model identifier to load
         adapter_path: Optional path to LoRA adapter, if None loads base model only
+        precision: "float32", "bfloat16" or "int8" (dynamic int8 quantization, CPU only)
         
     Returns:
         Tuple of (model, tokenizer)
     """    
     from peft import PeftModel
-    print(f"Loading base model: {base_model_id}")
+    print(f"Loading base model: {base_model_id} ({precision})")
     model = AutoModelForCausalLM.from_pretrained(
         base_model_id,
-        torch_dtype=torch.float32,
-        device_map="auto",
+        torch_dtype=torch.bfloat16 if precision == "bfloat16" else torch.float32,
+        device_map="cpu" if precision == "int8" else "auto",
         attn_implementation='eager',
     )
     tokenizer = AutoTokenizer.from_pretrained(base_model_id, trust_remote_code=True)
@@ -47,7 +48,7 @@ def load_trained_model(base_model_id: str, adapter_path: Optional[str]):
         model = model.merge_and_unload()
     else:
         print(f"No adapter found at {adapter_path}, using base model.")
-    return model, tokenizer
+    return apply_inference_precision(model, precision), tokenizer
 
 
 def calculate_reward(trace: Dict[str, Any]) -> float:
@@ -269,25 +270,31 @@ Begin your analysis by calling a tool."""
 def evaluate_model_performance(
    base_model_id: str,
    adapter_path: str,
-   test_scenarios_count: int = 20
+   test_scenarios_count: int = 20,
+   descriptor_kind: str = "llm"
 ):
    print(f"Generating {test_scenarios_count} fresh evaluation scenarios...")
    test_scenarios = []
    eval_seed_rng = random.Random(37)
+   descriptor = build_descriptor(descriptor_kind)
+   to_describe = []
    for i in range(test_scenarios_count):
        simulator = ConferenceSimulator(num_attendees=2000, seed=eval_seed_rng.randint(20000, 30000))
-       descriptor = PersonDescriptor(temperature=0.8)
        if len(simulator.attendees) < 2: continue
        p1_id, p2_id = eval_seed_rng.sample(list(simulator.attendees.keys()), 2)
        p1, p2 = simulator.attendees[p1_id], simulator.attendees[p2_id]
        ts_enum = eval_seed_rng.choice(list(TimeSlot))
-       p1_desc, p2_desc = descriptor.generate_description(p1, ts_enum), descriptor.generate_description(p2, ts_enum)
        ts_str = ts_enum.value.replace('_', ' ').title()
        _, gt_prob = simulator._calculate_meeting_success(p1, p2, ts_enum)
+       to_describe += [(p1, ts_enum), (p2, ts_enum)]
        test_scenarios.append({
-           'p1_desc': p1_desc, 'p2_desc': p2_desc, 'ts_str': ts_str,
+           'ts_str': ts_str,
            'ground_truth': gt_prob, 'scenario_id': i
        })
+   # Describe every attendee of every scenario in one concurrent batch.
+   descriptions = descriptor.generate_descriptions(to_describe)
+   for scenario, p1_desc, p2_desc in zip(test_scenarios, descriptions[::2], descriptions[1::2]):
+       scenario['p1_desc'], scenario['p2_desc'] = p1_desc, p2_desc
    
    baseline_results = run_local_agent_evaluation(base_model_id, test_scenarios, "baseline")
    trained_results = run_local_agent_evaluation(adapter_path, test_scenarios, "trained")
@@ -3,6 +3,7 @@ from dataclasses import dataclass, field
 from datasets import Dataset
 from datetime import datetime
 import glob
+from itertools import cycle
 import json
 import numpy as np
 import os
@@ -16,7 +17,7 @@ from transformers import AutoModelForCausalLM, AutoTokenizer, TrainingArguments
 from trl import SFTTrainer
 from typing import Dict, Any, List, Optional, Any
 
-from data_classes import  get_true_outcome, TimeSlot, ConferenceSimulator, PersonDescriptor, safe_extract_json
+from data_classes import  get_true_outcome, TimeSlot, ConferenceSimulator, safe_extract_json, AttendeePopulation, parse_person_profile, generate_stratified_scenarios, MeetingOracle, parse_time_slot, build_descriptor, get_meeting_predictor, predictor_registry, PERSON_TYPES, TIME_SLOTS
 
 from npcpy.npc_compiler import NPC
 from npcpy.llm_funcs import get_llm_response
@@ -45,7 +46,7 @@ def calculate_reward(trace: Dict[str, Any]) -> float:
 
 
 #### Core data classes
-from data_classes import  TimeSlot, ConferenceSimulator, PersonDescriptor, safe_extract_json
+from data_classes import  TimeSlot, ConferenceSimulator, safe_extract_json
 system_prompt_configurations = [
     {
         "name": "Pax",
@@ -221,7 +222,74 @@ def predict_follow_up_potential(person_a_desc: str, person_b_desc: str, time_slo
 
 
 
+def find_best_time_slot_tool(person_a_desc: str, person_b_desc: str) -> str:
+    """
+    Scores a meeting between two people in every conference time slot with one fast local simulator call.
+    
+    Args:
+        person_a_desc: Description of the first person including their role, energy, personality and mood
+        person_b_desc: Description of the second person including their role, energy, personality and mood
+        
+    Returns:
+        JSON string with the success probability for each time slot and the best time slot
+    """
+    population = AttendeePopulation.from_profiles([parse_person_profile(person_a_desc), parse_person_profile(person_b_desc)])
+    probabilities, best_slot = ConferenceSimulator(seed=42, population=population).score_pair_all_slots(0, 1)
+    return json.dumps({
+        "status": "success",
+        "slot_probabilities": {ts.value.replace('_', ' ').title(): round(float(p), 3) for ts, p in zip(TimeSlot, probabilities)},
+        "best_time_slot": best_slot.value.replace('_', ' ').title(),
+        "best_probability": round(float(probabilities.max()), 3),
+    })
+
+
+ORACLE_PATH = "models/meeting_oracle.npy"
+_meeting_oracle: Optional[MeetingOracle] = None
+
+
+def get_meeting_oracle() -> MeetingOracle:
+    """Loads the fitted oracle from ORACLE_PATH, fitting and saving it on first use."""
+    global _meeting_oracle
+    if _meeting_oracle is None:
+        if os.path.exists(ORACLE_PATH):
+            _meeting_oracle = MeetingOracle.load(ORACLE_PATH)
+        else:
+            _meeting_oracle = MeetingOracle.fit()
+            os.makedirs(os.path.dirname(ORACLE_PATH), exist_ok=True)
+            _meeting_oracle.save(ORACLE_PATH)
+    return _meeting_oracle
+
+
+def simulator_oracle_tool(person_a_desc: str, person_b_desc: str, time_slot: str) -> str:
+    """
+    Estimates the probability of a successful meeting with a lightweight model fitted to the conference simulator.
+    
+    Args:
+        person_a_desc: Description of the first person including their role, energy, personality and mood
+        person_b_desc: Description of the second person including their role, energy, personality and mood
+        time_slot: The time slot when the meeting would occur
+        
+    Returns:
+        JSON string with the estimated success probability
+    """
+    try:
+        slot = parse_time_slot(time_slot)
+    except ValueError as e:
+        return json.dumps({"status": "error", "message": str(e)})
+    probability = get_meeting_oracle().predict_profiles(parse_person_profile(person_a_desc), parse_person_profile(person_b_desc), slot)
+    return json.dumps({"status": "success", "probability": round(probability, 3)})
+
+
 #### Set up your fine tuning predictor tool!
+SFT_MODEL_PATH = "models/sft_prediction_model_gemma_270m"
+# "generate" samples the full JSON answer; opt into "logits" to read the probability in one or two
+# forward passes, with the reason taken from its probability band.
+SFT_READOUT = "generate"
+# Several personas evaluate the same scenarios, so with the deterministic "logits" readout repeated
+# predictions are served from an LRU cache (sampled "generate" answers are not cached).
+SFT_CACHE_SIZE = 4096
+
+
 def predict_meeting_success_tool(person_a_desc: str, person_b_desc: str, time_slot: str) -> str:
     """
     Predicts the probability of a successful meeting between two people at a given time slot.
@@ -234,14 +302,13 @@ def predict_meeting_success_tool(person_a_desc: str, person_b_desc: str, time_sl
     Returns:
         JSON string containing success probability and reasoning
     """
-    model_path = "models/sft_prediction_model_gemma_270m"
+    model_path = SFT_MODEL_PATH
     if not os.path.exists(model_path):
         return json.dumps({"status": "error", "message": "SFT model not found."})
     try:
-        # Your code here
-        # Should be two lines        
-        #intermediate = ...
-        #result = intermediate.some_method(...)
+        # The registry loads the predictor once per process instead of on every tool call.
+        predictor = get_meeting_predictor(model_path, readout=SFT_READOUT, cache_size=SFT_CACHE_SIZE)
+        result = predictor.predict(person_a_desc, person_b_desc, time_slot)
 
         if 'probability' not in result:
             return json.dumps({"status": "error", "message": "SFT prediction missing data."})
@@ -258,6 +325,8 @@ TOOLS = [
     extract_common_interests_and_topics,
     assess_time_slot_fit_and_energy,
     predict_follow_up_potential,
+    find_best_time_slot_tool,
+    simulator_oracle_tool,
 ]
 
 
@@ -369,18 +438,26 @@ class AgentToolLoop:
 
 
 
-def generate_agent_traces_for_training(num_scenarios_per_agent: int) -> List[Dict[str, Any]]:
+def generate_agent_traces_for_training(num_scenarios_per_agent: int, stratified: bool = False, descriptor_kind: str = "llm") -> List[Dict[str, Any]]:
     """
     Generates training traces by running agents through scenarios with different system prompts.
     
     Args:
         num_scenarios_per_agent: An integer for the number of scenarios to explore per system prompt
+        stratified: If True, draw scenarios evenly across ground-truth probability, type pair and slot bins instead of uniformly
+        descriptor_kind: "llm" or "template", see `build_descriptor`
         
     Returns:
         List of trace dictionaries containing agent decisions and outcomes
     """
     traces_collector = AgentTraceCollector()
-    descriptor = PersonDescriptor(temperature=0.8)
+    descriptor = build_descriptor(descriptor_kind)
+    if stratified:
+        simulator = ConferenceSimulator(num_attendees=2000, seed=random.randint(0, 10000))
+        # Probability bins x unordered type pairs x slots; the list comes back shuffled, so even when
+        # there are fewer traces than bins the ones used are spread evenly over all three axes.
+        num_bins = 5 * len(PERSON_TYPES) * (len(PERSON_TYPES) + 1) // 2 * len(TIME_SLOTS)
+        scenarios = cycle(generate_stratified_scenarios(simulator, per_bin=-(-num_scenarios_per_agent * len(system_prompt_configurations) // num_bins)))
     for config in system_prompt_configurations:
         print(f"\n Generating traces for agent: {config['name']} ")
         for j in range(num_scenarios_per_agent):
@@ -392,14 +469,18 @@ def generate_agent_traces_for_training(num_scenarios_per_agent: int) -> List[Dic
                 provider='ollama',
             )
             tool_loop = AgentToolLoop(current_agent, max_iterations=8)
-            simulator = ConferenceSimulator(num_attendees=50, seed=random.randint(0, 10000))
-            p1_id, p2_id = random.sample(list(simulator.attendees.keys()), 2)
-            person_a, person_b = simulator.attendees[p1_id], simulator.attendees[p2_id]
-            time_slot = random.choice(list(TimeSlot))
-            p1_desc = descriptor.generate_description(person_a, time_slot)
-            p2_desc = descriptor.generate_description(person_b, time_slot)
+            if stratified:
+                scenario = next(scenarios)
+                person_a, person_b = simulator.attendees[scenario["person_a_id"]], simulator.attendees[scenario["person_b_id"]]
+                time_slot, gt_prob = scenario["time_slot"], scenario["ground_truth"]
+            else:
+                simulator = ConferenceSimulator(num_attendees=50, seed=random.randint(0, 10000))
+                p1_id, p2_id = random.sample(list(simulator.attendees.keys()), 2)
+                person_a, person_b = simulator.attendees[p1_id], simulator.attendees[p2_id]
+                time_slot = random.choice(list(TimeSlot))
+                _, gt_prob = simulator._calculate_meeting_success(person_a, person_b, time_slot)
+            p1_desc, p2_desc = descriptor.generate_descriptions([(person_a, time_slot), (person_b, time_slot)])
             ts_str = time_slot.value.replace('_', ' ').title()
-            _, gt_prob = simulator._calculate_meeting_success(person_a, person_b, time_slot)
             initial_prompt = f"""Your task is to decide if two people should meet. Use the available tools to gather information step-by-step. When you have enough information, stop using tools and provide your final answer as a single JSON object.
 
 Person A: {p1_desc}
@@ -438,6 +519,8 @@ if __name__ == "__main__":
     csv_pattern = "agent_traces_*.csv"
     existing_csvs = sorted(glob.glob(csv_pattern), key=os.path.getmtime, reverse=True)
     num_traces_per_agent = 'YOUR CODE HERE'
+    if os.path.exists(SFT_MODEL_PATH):
+        predictor_registry.preload([SFT_MODEL_PATH], readout=SFT_READOUT, cache_size=SFT_CACHE_SIZE)
     generated_traces_list = generate_agent_traces_for_training(num_traces_per_agent)
     traces_csv_file = f"agent_traces_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
     temp_collector = AgentTraceCollector()
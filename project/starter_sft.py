@@ -1,6 +1,6 @@
 # Structured Fine Tuning STARTER 
 from dataclasses import dataclass, field
-from datasets import Dataset
+from datasets import Dataset, IterableDataset
 from datetime import datetime
 import glob
 import json
@@ -22,7 +22,7 @@ from npcpy.llm_funcs import get_llm_response
 
 
 #### Core data classes
-from data_classes import TimeSlot, ConferenceSimulator, PersonDescriptor, safe_extract_json, MeetingPredictor
+from data_classes import TimeSlot, ConferenceSimulator, PersonDescriptor, safe_extract_json, MeetingPredictor, simulator_sft_examples, build_descriptor
 
 
 
@@ -48,6 +48,47 @@ class SFTConfig:
     optim: str = "adamw_torch"
     lr_scheduler_type: str = "cosine_with_restarts"  
     weight_decay: float = 'YOUR CODE HERE'
+    # Streaming mode: train on fresh simulator scenarios instead of sft_data_path.
+    # An unbounded stream has no epoch length, so max_steps must be positive and sets the
+    # length of training; run_sft_fine_tuning rejects the default -1 when streaming.
+    stream_from_simulator: bool = False
+    stream_seed: int = 0
+    stream_num_shards: int = 64
+    stream_num_workers: int = 2
+    stream_prefetch_factor: int = 4
+    # Each streamed conference warms up for 0..stream_warmup_slots slots; 0 samples all nine slots from a fresh
+    # conference, like trace generation and evaluation do.
+    stream_warmup_slots: int = 0
+    stream_factor_reasons: bool = False
+    # "llm" describes attendees with PersonDescriptor; "template" with the LLM-free TemplatePersonDescriptor.
+    descriptor: str = "llm"
+    max_steps: int = -1
+    val_batch_size: int = 8
+
+
+def format_sft_example(example: Dict) -> Dict:
+    target_str = json.dumps(example['target_json_output'])
+    return {"text": f"<start_of_turn>user\n{example['input_text']}<end_of_turn>\n<start_of_turn>model\n{target_str}<end_of_turn>"}
+
+
+def build_streaming_sft_dataset(config: SFTConfig, descriptor=None) -> IterableDataset:
+    """
+    Builds an unbounded SFT dataset that pulls examples straight from ConferenceSimulator.
+
+    The stream is split into `stream_num_shards` shards so the Trainer's DataLoader can
+    hand them out to `stream_num_workers` prefetching worker processes.
+    """
+    dataset = IterableDataset.from_generator(
+        simulator_sft_examples,
+        gen_kwargs={
+            "descriptor": descriptor or build_descriptor(config.descriptor),
+            "seed": config.stream_seed,
+            "shards": list(range(config.stream_num_shards)),
+            "warmup_slots": config.stream_warmup_slots,
+            "factor_reasons": config.stream_factor_reasons,
+        },
+    )
+    return dataset.map(format_sft_example).select_columns(["text"])
 
 def validate_model(predictor: MeetingPredictor, val_examples: List[Dict], num_samples: int = 20):
     predictions = []
@@ -71,28 +112,24 @@ def validate_model(predictor: MeetingPredictor, val_examples: List[Dict], num_sa
     return correlation, mae, predictions, ground_truths
 
 def run_sft_fine_tuning(config: SFTConfig, train_examples: List[Dict] = None, val_examples: List[Dict] = None):
-    if train_examples is None:
-        #
-        dataset = load_dataset('csv', data_files=config.sft_data_path, split='train')
-        
-        formatted_examples = []
-        for example in dataset:
-            target_str = json.dumps(example['target_json_output'])
-            text = f"<start_of_turn>user\n{example['input_text']}<end_of_turn>\n<start_of_turn>model\n{target_str}<end_of_turn>"
-            formatted_examples.append({"text": text})
+    if config.stream_from_simulator:
+        if config.max_steps <= 0:
+            raise ValueError(f"stream_from_simulator needs a positive max_steps (got {config.max_steps}): the stream has no length to derive epochs from")
+        print(" Streaming training examples from the conference simulator ")
+        dataset = build_streaming_sft_dataset(config)
     else:
-        print(" Using provided training examples ")
-        formatted_examples = []
-        for example in train_examples:
-            target_str = json.dumps(example['target_json_output'])
-            text = f"<start_of_turn>user\n{example['input_text']}<end_of_turn>\n<start_of_turn>model\n{target_str}<end_of_turn>"
-            formatted_examples.append({"text": text})
-    
+        if train_examples is None:
+            #
+            dataset = load_dataset('csv', data_files=config.sft_data_path, split='train')
+            formatted_examples = [format_sft_example(example) for example in dataset]
+        else:
+            print(" Using provided training examples ")
+            formatted_examples = [format_sft_example(example) for example in train_examples]
 
-    #set up the Model for training and train:
+        #set up the Model for training and train:
 
-    dataset = Dataset.from_list(formatted_examples)
-    print(f"Dataset created with {len(dataset)} examples")
+        dataset = Dataset.from_list(formatted_examples)
+        print(f"Dataset created with {len(dataset)} examples")
     
     print(f"\n Configuring Model ('{config.base_model_name}') for SFT ")
     
@@ -116,6 +153,7 @@ def run_sft_fine_tuning(config: SFTConfig, train_examples: List[Dict] = None, va
     training_args = TrainingArguments(
         output_dir=config.output_model_path, 
         num_train_epochs=config.num_train_epochs,
+        max_steps=config.max_steps,
         per_device_train_batch_size=config.per_device_train_batch_size, 
         gradient_accumulation_steps=config.gradient_accumulation_steps,
         optim=config.optim, 
@@ -124,7 +162,9 @@ def run_sft_fine_tuning(config: SFTConfig, train_examples: List[Dict] = None, va
         fp16=config.fp16, 
         bf16=config.bf16, 
         lr_scheduler_type=config.lr_scheduler_type, 
-        group_by_length=True, 
+        group_by_length=not config.stream_from_simulator, 
+        dataloader_num_workers=config.stream_num_workers if config.stream_from_simulator else 0,
+        dataloader_prefetch_factor=config.stream_prefetch_factor if config.stream_from_simulator else None,
         save_steps=50,
         weight_decay= config.weight_decay
     )
@@ -162,13 +202,17 @@ def run_sft_fine_tuning(config: SFTConfig, train_examples: List[Dict] = None, va
             val_ground_truths = []
             
             trainer.model.eval()
-            for i, val_example in enumerate(val_examples[:50]):
-
-                test_prompt = f"<start_of_turn>user\n{val_example['input_text']}<end_of_turn>\n<start_of_turn>model\n"
-                inputs = tokenizer(test_prompt, 
+            val_batch = val_examples[:50]
+            response_texts = []
+            for start in range(0, len(val_batch), config.val_batch_size):
+                test_prompts = [f"<start_of_turn>user\n{val_example['input_text']}<end_of_turn>\n<start_of_turn>model\n"
+                                for val_example in val_batch[start:start + config.val_batch_size]]
+                # Left padding (per call, so training keeps right padding) lets a whole batch generate from the same position.
+                inputs = tokenizer(test_prompts, 
                                    return_tensors="pt", 
                                    truncation=True, 
-                                   padding=True)
+                                   padding=True,
+                                   padding_side="left")
                 input_ids = inputs.input_ids.to(device)
                 attention_mask = inputs.attention_mask.to(device)
 
@@ -180,8 +224,10 @@ def run_sft_fine_tuning(config: SFTConfig, train_examples: List[Dict] = None, va
                         do_sample=False,
                         pad_token_id=tokenizer.eos_token_id,
                     )
-                    response_text = tokenizer.decode(outputs[0], 
-                                                     skip_special_tokens=True)                
+                    response_texts += tokenizer.batch_decode(outputs[:, input_ids.shape[1]:], 
+                                                             skip_special_tokens=True)
+
+            for i, (val_example, response_text) in enumerate(zip(val_batch, response_texts)):
                 try:
                     parsed_json = safe_extract_json(response_text)
                     predicted_prob = float(parsed_json['probability'])